@@ -9,3 +9,8 @@ mod.setting("ui_elements_hints_button_first_char", type=str, default="b")
 mod.setting("ui_elements_hints_input_text_first_char", type=str, default="i")
 mod.setting("ui_elements_hints_link_first_char", type=str, default="l")
 mod.setting("ui_elements_scroll_speed", type=int, default=45)
+mod.setting("ui_elements_resize_layout_interval", type=int, default=0, desc="Max rate (ms) of live layout while resizing a window. 0 shows only the resize outline and lays out on release")
+mod.setting("ui_elements_scroll_smooth", type=bool, default=False, desc="Glide toward the scroll target on each animation frame instead of jumping")
+mod.setting("ui_elements_threaded_layout", type=bool, default=False, desc="Lay out the node tree on a background thread so large trees don't block Talon while rendering")
+mod.setting("ui_elements_icon_raster", type=bool, default=False, desc="Draw built-in icons as one pre-rendered image per icon instead of svg path nodes")
+mod.setting("ui_elements_debug_ref_counts", type=bool, default=False, desc="Track live node counts for ui_elements_debug_gc")
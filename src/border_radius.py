@@ -118,3 +118,24 @@ def draw_manual_rounded_rect_path(rect: Rect, border_radius: BorderRadius) -> Pa
 
     path.close()
     return path
+
+ROUNDED_RECT_PATH_CACHE_SIZE = 256
+_rounded_rect_path_cache: dict[tuple, Path] = {}
+
+def get_rounded_rect_path(rect: Rect, border_radius: BorderRadius) -> Path:
+    """Shared, bounded cache over draw_manual_rounded_rect_path. Returned paths must not be mutated."""
+    key = (
+        rect.x, rect.y, rect.width, rect.height,
+        border_radius.top_left, border_radius.top_right,
+        border_radius.bottom_right, border_radius.bottom_left
+    )
+    path = _rounded_rect_path_cache.get(key)
+    if path is None:
+        if len(_rounded_rect_path_cache) >= ROUNDED_RECT_PATH_CACHE_SIZE:
+            _rounded_rect_path_cache.pop(next(iter(_rounded_rect_path_cache)))
+        path = draw_manual_rounded_rect_path(rect, border_radius)
+        _rounded_rect_path_cache[key] = path
+    return path
+
+def clear_rounded_rect_path_cache():
+    _rounded_rect_path_cache.clear()
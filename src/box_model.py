@@ -95,6 +95,20 @@ class BoxModelV2(BoxModelV2Type):
         clip_nodes: list[NodeType] = [],
         relative_positional_node: NodeType = None,
     ):
+        self.reset(properties, content_size, clip_nodes, relative_positional_node)
+
+    def reset(
+        self,
+        properties: PropertiesDimensionalType,
+        content_size: Size2d = Size2d(0, 0),
+        clip_nodes: list[NodeType] = [],
+        relative_positional_node: NodeType = None,
+    ):
+        """
+        (Re)initialize every field from `properties`, so an instance can be
+        recycled by a NodePool. Anything assigned later in layout must be
+        initialized here as well.
+        """
         self.id = properties.id
         self.width = properties.width
         self.height = properties.height
@@ -149,6 +163,8 @@ class BoxModelV2(BoxModelV2Type):
 
         self.clip_nodes = clip_nodes
         self.relative_positional_node = relative_positional_node
+        self.scroll_bar_width = scale_value(DEFAULT_SCROLL_BAR_WIDTH)
+        self.invalidate_rects()
 
         if isinstance(self.width, str):
             if "%" in self.width:
@@ -164,25 +180,44 @@ class BoxModelV2(BoxModelV2Type):
 
         self.init_intrinsic_sizes(content_size)
 
+    # Rects are cached until the next size or position change, so hit
+    # testing on mouse move doesn't allocate. Treat them as read-only.
+    def invalidate_rects(self):
+        self._margin_rect = None
+        self._border_rect = None
+        self._padding_rect = None
+        self._content_rect = None
+        self._content_children_rect = None
+
     @property
     def margin_rect(self):
-        return Rect(self.margin_pos.x, self.margin_pos.y, self.margin_size.width, self.margin_size.height)
+        if self._margin_rect is None:
+            self._margin_rect = Rect(self.margin_pos.x, self.margin_pos.y, self.margin_size.width, self.margin_size.height)
+        return self._margin_rect
 
     @property
     def border_rect(self):
-        return Rect(self.border_pos.x, self.border_pos.y, self.border_size.width, self.border_size.height)
+        if self._border_rect is None:
+            self._border_rect = Rect(self.border_pos.x, self.border_pos.y, self.border_size.width, self.border_size.height)
+        return self._border_rect
 
     @property
     def padding_rect(self):
-        return Rect(self.padding_pos.x, self.padding_pos.y, self.padding_size.width, self.padding_size.height)
+        if self._padding_rect is None:
+            self._padding_rect = Rect(self.padding_pos.x, self.padding_pos.y, self.padding_size.width, self.padding_size.height)
+        return self._padding_rect
 
     @property
     def content_rect(self):
-        return Rect(self.content_pos.x, self.content_pos.y, self.content_size.width, self.content_size.height)
+        if self._content_rect is None:
+            self._content_rect = Rect(self.content_pos.x, self.content_pos.y, self.content_size.width, self.content_size.height)
+        return self._content_rect
 
     @property
     def content_children_rect(self):
-        return Rect(self.content_children_pos.x, self.content_children_pos.y, self.content_children_size.width, self.content_children_size.height)
+        if self._content_children_rect is None:
+            self._content_children_rect = Rect(self.content_children_pos.x, self.content_children_pos.y, self.content_children_size.width, self.content_children_size.height)
+        return self._content_children_rect
 
     @property
     def content_children_with_padding_size(self):
@@ -202,11 +237,11 @@ class BoxModelV2(BoxModelV2Type):
 
     @property
     def conditional_scroll_bar_y_width(self):
-        return scale_value(DEFAULT_SCROLL_BAR_WIDTH) if self.has_scroll_bar_y() else 0
+        return self.scroll_bar_width if self.has_scroll_bar_y() else 0
 
     @property
     def conditional_scroll_bar_x_height(self):
-        return scale_value(DEFAULT_SCROLL_BAR_WIDTH) if self.has_scroll_bar_x() else 0
+        return self.scroll_bar_width if self.has_scroll_bar_x() else 0
 
     @classmethod
     def _resolve_percent(self, value, total):
@@ -324,6 +359,7 @@ class BoxModelV2(BoxModelV2Type):
         self.init_calculated_sizes()
 
     def shrink_content_children_size(self, shrunk_content_children_size: Size2d):
+        self.invalidate_rects()
         if shrunk_content_children_size.width < self.content_children_size.width:
             self.content_children_size.width = shrunk_content_children_size.width
         if shrunk_content_children_size.height < self.content_children_size.height:
@@ -475,6 +511,7 @@ class BoxModelV2(BoxModelV2Type):
         self.padding_size = Size2d(padding_width, padding_height)
         self.content_size = Size2d(content_width, content_height)
         self.content_children_size = Size2d(content_children_width, content_children_height)
+        self.invalidate_rects()
 
         content_constraint_size = Size2d(content_constraint_width, content_constraint_height) \
             if content_constraint_width or content_constraint_height else None
@@ -482,6 +519,7 @@ class BoxModelV2(BoxModelV2Type):
         return content_constraint_size
 
     def reposition(self, offset: Point2d):
+        self.invalidate_rects()
         self.margin_pos += offset
         self.border_pos += offset
         self.padding_pos += offset
@@ -549,6 +587,7 @@ class BoxModelV2(BoxModelV2Type):
         cursor.move_to(x, y)
 
     def position_for_render(self, cursor: Point2d, flex_direction: str = "column", align_items: str = "stretch", justify_content: str = "flex_start"):
+        self.invalidate_rects()
         self.margin_pos = cursor.to_point2d()
         self.border_pos = Point2d(
             self.margin_pos.x + self.margin_spacing.left,
@@ -610,7 +649,7 @@ class BoxModelV2(BoxModelV2Type):
             self.scroll_bar_track_rect = Rect(
                 self.padding_pos.x + self.padding_size.width,
                 self.padding_pos.y,
-                scale_value(DEFAULT_SCROLL_BAR_WIDTH),
+                self.scroll_bar_width,
                 self.padding_size.height
 )
 
@@ -622,12 +661,17 @@ class BoxModelV2(BoxModelV2Type):
             self.scroll_bar_thumb_rect = Rect(
                 self.padding_pos.x + self.padding_size.width,
                 thumb_pos_y,
-                scale_value(DEFAULT_SCROLL_BAR_WIDTH),
+                self.scroll_bar_width,
                 thumb_height
             )
 
+    def shift_content_children(self, offset: Point2d):
+        self.content_children_pos += offset
+        self._content_children_rect = None
+
     def adjust_scroll_y(self, offset_y: int):
         self.content_children_pos.y += offset_y
+        self._content_children_rect = None
         self.resolve_scroll_bar_rects(offset_y)
 
     def resolve_scroll_bar_x_rects(self, offset_x):
@@ -639,7 +683,7 @@ class BoxModelV2(BoxModelV2Type):
                 self.padding_pos.x,
                 self.padding_pos.y + self.padding_size.height,
                 self.padding_size.width,
-                scale_value(DEFAULT_SCROLL_BAR_WIDTH)
+                self.scroll_bar_width
             )
 
             thumb_width = view_width * (view_width / total_scrollable_width)
@@ -651,11 +695,12 @@ class BoxModelV2(BoxModelV2Type):
                 thumb_pos_x,
                 self.padding_pos.y + self.padding_size.height,
                 thumb_width,
-                scale_value(DEFAULT_SCROLL_BAR_WIDTH)
+                self.scroll_bar_width
             )
 
     def adjust_scroll_x(self, offset_x: int):
         self.content_children_pos.x += offset_x
+        self._content_children_rect = None
         self.resolve_scroll_bar_x_rects(offset_x)
 
     def gc(self):
@@ -0,0 +1,56 @@
+from .interfaces import PropertiesType
+from .utils import hex_color
+
+CASCADED_COLOR_PROPERTIES = ("color", "stroke")
+
+class CascadedStyle:
+    """
+    Resolved values a node passes down to its children.
+
+    Built once per node from its `cascaded_properties`, then treated as
+    immutable. A child that ends up with exactly the same values (i.e. it
+    only inherited) references its parent's instance instead of building
+    its own, so a deep tree resolves each distinct configuration once.
+    """
+    __slots__ = (
+        "values",
+        "highlight_source",
+        "highlight_style",
+        "highlight_style_svg",
+        "opacity",
+    )
+
+    def __init__(self, properties: PropertiesType, cascaded_properties: set[str]):
+        values = []
+        self.highlight_source = None
+        self.highlight_style = None
+        self.highlight_style_svg = None
+
+        for prop in cascaded_properties:
+            if prop == "highlight_style":
+                highlight_style = properties.highlight_style
+                self.highlight_source = highlight_style
+                self.highlight_style = {
+                    "color": highlight_style.get("color", None),
+                }
+                self.highlight_style_svg = {
+                    "stroke": highlight_style.get("stroke", None) \
+                        or highlight_style.get("color", None),
+                }
+            else:
+                value = getattr(properties, prop, None)
+                if prop in CASCADED_COLOR_PROPERTIES:
+                    value = hex_color(value, property_name=prop)
+                values.append((prop, value))
+
+        self.values: tuple = tuple(values)
+        self.opacity: bool = "opacity" in cascaded_properties
+
+    def is_unchanged_in(self, properties: PropertiesType) -> bool:
+        """Whether `properties` would cascade exactly the same values"""
+        for prop, value in self.values:
+            if getattr(properties, prop, None) != value:
+                return False
+        if self.highlight_source is not None:
+            return properties.highlight_style == self.highlight_source
+        return True
@@ -0,0 +1,97 @@
+from talon.skia import RoundRect
+from talon.skia.canvas import Canvas as SkiaCanvas
+from talon.types import Rect, Point2d
+from .border_radius import BorderRadius, get_rounded_rect_path
+
+def _is_inside_rounded_rect(rect: Rect, outer: Rect, border_radius: BorderRadius) -> bool:
+    """
+    Conservative check that `rect` is not affected by the rounded corners
+    of `outer`, i.e. it fits inside the inner "cross" of the rounded rect.
+    """
+    radius = max(
+        border_radius.top_left,
+        border_radius.top_right,
+        border_radius.bottom_right,
+        border_radius.bottom_left
+    )
+    left, top = outer.x, outer.y
+    right, bot = outer.x + outer.width, outer.y + outer.height
+    if rect.x < left or rect.y < top or rect.x + rect.width > right or rect.y + rect.height > bot:
+        return False
+    fits_x = rect.x >= left + radius and rect.x + rect.width <= right - radius
+    fits_y = rect.y >= top + radius and rect.y + rect.height <= bot - radius
+    return fits_x or fits_y
+
+class ClipRegion:
+    """
+    Flattened, pre-intersected clip for a node.
+
+    All rectangular ancestor clips are intersected into a single `rect`.
+    Rounded clips that can still affect the result are kept in `rounded`
+    as (rect, border_radius) pairs, and are drawn with shared cached paths.
+    Applying a region costs a single save/restore pair.
+    """
+    def __init__(self, rect: Rect, rounded: list[tuple[Rect, BorderRadius]] = None):
+        self.rect = rect
+        self.rounded = rounded or []
+
+    @staticmethod
+    def from_rect(rect: Rect, border_radius: BorderRadius = None) -> "ClipRegion":
+        rounded = [(rect, border_radius)] if border_radius else None
+        return ClipRegion(rect.copy(), rounded)
+
+    @staticmethod
+    def from_clip_nodes(clip_nodes: list) -> "ClipRegion":
+        """Flatten a list of weakrefs to clip nodes. Returns None if nothing clips."""
+        region = None
+        for clip_ref in clip_nodes:
+            clip_node = clip_ref()
+            if clip_node and clip_node.box_model:
+                rect = clip_node.box_model.padding_rect
+                border_radius = clip_node.properties.get_border_radius() \
+                    if clip_node.properties.has_border_radius() \
+                    else None
+                region = region.intersect(rect, border_radius) \
+                    if region \
+                    else ClipRegion.from_rect(rect, border_radius)
+        return region
+
+    def intersect(self, rect: Rect, border_radius: BorderRadius = None) -> "ClipRegion":
+        new_rect = self.rect.intersect(rect)
+        rounded = list(self.rounded)
+        if border_radius:
+            rounded.append((rect, border_radius))
+        rounded = [
+            (r, br) for r, br in rounded
+            if not _is_inside_rounded_rect(new_rect, r, br)
+        ]
+        return ClipRegion(new_rect, rounded)
+
+    def _needs_rect_clip(self) -> bool:
+        # A single rounded clip that spans the whole region makes the rect clip redundant
+        if len(self.rounded) == 1:
+            r = self.rounded[0][0]
+            return not (
+                r.x == self.rect.x and r.y == self.rect.y and
+                r.width == self.rect.width and r.height == self.rect.height
+            )
+        return True
+
+    def apply(self, c: SkiaCanvas, offset: Point2d = None) -> int:
+        """Save the canvas and clip it to this region. Returns the number of saves."""
+        c.save()
+        has_offset = offset and (offset.x or offset.y)
+        if has_offset:
+            c.translate(offset.x, offset.y)
+
+        if self._needs_rect_clip():
+            c.clip_rect(self.rect)
+        for rect, border_radius in self.rounded:
+            if border_radius.is_uniform():
+                c.clip_rrect(RoundRect.from_rect(rect, x=border_radius.top_left, y=border_radius.top_left))
+            else:
+                c.clip_path(get_rounded_rect_path(rect, border_radius))
+
+        if has_offset:
+            c.translate(-offset.x, -offset.y)
+        return 1
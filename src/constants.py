@@ -16,6 +16,9 @@ DEFAULT_INTERACTIVE_BORDER_COLOR = "888888"
 DEFAULT_INTERACTIVE_BORDER_WIDTH = 1.0
 DEFAULT_INTERACTIVE_HIGHLIGHT_COLOR = "88888833"
 DEFAULT_CURSOR_REFRESH_RATE = 16
+CURSOR_IDLE_TICKS = 30
+CURSOR_IDLE_POLL_INTERVAL = "50ms"
+HOVER_VALIDATION_QUIET_TIME = 0.2
 DEFAULT_SCROLL_BAR_WIDTH = 10.0
 DEFAULT_SCROLL_BAR_TRACK_COLOR = "FFFFFF22"
 DEFAULT_SCROLL_BAR_THUMB_COLOR = "FFFFFF44"
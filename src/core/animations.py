@@ -1,6 +1,5 @@
 import time
 from dataclasses import dataclass
-from talon import cron
 from ..utils import hex_color
 from ..border_radius import BorderRadius
 
@@ -75,6 +74,9 @@ ANIMATABLE_BORDER_RADIUS = {"border_radius"}
 
 ANIMATABLE_PROPERTIES = ANIMATABLE_NUMERIC_PROPERTIES | ANIMATABLE_COLOR_PROPERTIES | ANIMATABLE_BORDER_RADIUS
 
+# Animating only these doesn't move anything, so frames can repaint just the changed nodes
+ANIMATABLE_PAINT_ONLY_PROPERTIES = ANIMATABLE_COLOR_PROPERTIES | {"opacity"}
+
 
 @dataclass
 class ActiveAnimation:
@@ -147,11 +149,13 @@ class TransitionManager:
         self.active = {}  # {node_id: {property: ActiveAnimation}}
         self.highlight_anims = {}  # {node_id: HighlightAnimation}
         self.previous_values = {}  # {node_id: {property: value}}
-        self.tick_job = None
+        self.frame_callbacks = []  # callables returning True while they need more frames
         self._unmount_callback = None
         self._pending_mount_values = []
         self._mount_animations_pending = False
         self._last_tick_time = None
+        self.changed_node_ids = set()
+        self.layout_changed = False
 
     def _parse_transition_config(self, transition_dict, property_name):
         """Parse transition config for a property. Returns (duration_ms, easing) or None."""
@@ -409,9 +413,23 @@ class TransitionManager:
 
     def tick(self):
         """Called every 16ms. Interpolates values, applies to nodes, triggers repaint."""
-        if (not self.active and not self.highlight_anims) or not self.tree:
+        if not self.tree:
             self.stop_tick_loop()
-            if not self.active and not self.highlight_anims and self._unmount_callback:
+            return
+
+        if self.tree.layout_worker.is_busy():
+            # Nodes are being laid out off thread. Skipped ticks count as a
+            # gap below, so animations pause instead of jumping.
+            return
+
+        if self.frame_callbacks and not self.tree.destroying:
+            self.frame_callbacks = [callback for callback in self.frame_callbacks if callback()]
+
+        if not self.active and not self.highlight_anims:
+            if self.frame_callbacks:
+                return
+            self.stop_tick_loop()
+            if self._unmount_callback:
                 callback = self._unmount_callback
                 self._unmount_callback = None
                 callback()
@@ -449,6 +467,9 @@ class TransitionManager:
 
             done_props = []
             has_opacity = "opacity" in animations
+            self.changed_node_ids.add(node_id)
+            if not self.layout_changed and not animations.keys() <= ANIMATABLE_PAINT_ONLY_PROPERTIES:
+                self.layout_changed = True
 
             # Apply non-opacity properties first
             for prop, anim in list(animations.items()):
@@ -513,7 +534,7 @@ class TransitionManager:
             if highlight_needs_decorator_redraw and self.tree.canvas_decorator:
                 self.tree.canvas_decorator.freeze()
 
-        if not self.active and not self.highlight_anims:
+        if not self.active and not self.highlight_anims and not self.frame_callbacks:
             self.stop_tick_loop()
             if self._unmount_callback:
                 callback = self._unmount_callback
@@ -603,14 +624,22 @@ class TransitionManager:
 
     def start_tick_loop(self):
         """Start the 16ms tick loop if not already running."""
-        if not self.tick_job and (self.active or self.highlight_anims):
-            self.tick_job = cron.interval("16ms", self.tick)
+        if not self.tree:
+            return
+        scheduler = self.tree.scheduler
+        if not scheduler.is_scheduled("animation_tick") and (self.active or self.highlight_anims or self.frame_callbacks):
+            scheduler.interval("animation_tick", "16ms", self.tick)
+
+    def add_frame_callback(self, callback):
+        """Run `callback` on every tick until it returns False."""
+        if callback not in self.frame_callbacks:
+            self.frame_callbacks.append(callback)
+        self.start_tick_loop()
 
     def stop_tick_loop(self):
         """Cancel the tick loop when no active animations remain."""
-        if self.tick_job:
-            cron.cancel(self.tick_job)
-            self.tick_job = None
+        if self.tree and self.tree.scheduler.is_scheduled("animation_tick"):
+            self.tree.scheduler.cancel("animation_tick")
             self._last_tick_time = None
 
     def clear_node(self, node_id):
@@ -619,6 +648,16 @@ class TransitionManager:
         self.previous_values.pop(node_id, None)
         self.highlight_anims.pop(node_id, None)
 
+    def consume_changes(self) -> tuple[set[str], bool]:
+        """
+        Node ids changed by ticks since the last call, and whether any of
+        those changes can affect layout.
+        """
+        changes = (self.changed_node_ids, self.layout_changed)
+        self.changed_node_ids = set()
+        self.layout_changed = False
+        return changes
+
     def has_active_animations(self):
         return bool(self.active) or bool(self.highlight_anims)
 
@@ -628,6 +667,9 @@ class TransitionManager:
         self.active.clear()
         self.highlight_anims.clear()
         self.previous_values.clear()
+        self.frame_callbacks.clear()
+        self.changed_node_ids.clear()
+        self.layout_changed = False
         self._unmount_callback = None
         self._pending_mount_values.clear()
         self._mount_animations_pending = False
@@ -1,10 +1,14 @@
 from talon.experimental.textarea import DarkThemeLabels, TextArea
 from dataclasses import dataclass
 from talon.skia.typeface import Typeface
-from talon import storage, settings
+from talon import settings
 from typing import Union
 from ..interfaces import NodeType, TreeType, Point2d
+from .layout_store import layout_store
 from .store import store
+from .state_manager import state_manager
+from ..paints import paint_registry
+from ..shadow_cache import shadow_cache
 from ..utils import generate_hash
 from ..hints import show_scale_notification
 
@@ -162,6 +166,9 @@ class EntityManager:
         print("store.reactive_state", store.reactive_state)
         print("store.staged_effects", store.staged_effects)
         print("store.mouse_state", store.mouse_state)
+        print("paint_registry.stats", paint_registry.get_stats())
+        print("shadow_cache.stats", shadow_cache.get_stats())
+        print("layout_store.stats", layout_store.get_stats())
 
         for index, tree in enumerate(store.trees):
             print(f"\n------------\nTree #{index}")
@@ -175,12 +182,17 @@ class EntityManager:
             print("tree.meta_state.ref_property_overrides", tree.meta_state.ref_property_overrides)
             print("tree.meta_state.focused_id", tree.meta_state.focused_id)
             print("tree.meta_state.unhighlight_jobs", tree.meta_state.unhighlight_jobs)
+            print("tree.scroll_input.stats", tree.scroll_input.get_stats())
+            print("tree.node_pool.stats", tree.node_pool.get_stats())
+            print("tree.scheduler.stats", tree.scheduler.get_stats())
+            print("tree.layout_worker.stats", tree.layout_worker.get_stats())
 
     def set_scale(self, scale: float, tree: TreeType = None, persist: bool = False):
         clamped_scale = max(0.5, min(3.0, scale))
 
         if tree:
             tree.scale = clamped_scale
+            state_manager.refresh_scale_context()
             if persist:
                 default_scale = settings.get("user.ui_elements_scale", 1.0)
                 if clamped_scale == default_scale:
@@ -201,25 +213,17 @@ class EntityManager:
                     else:
                         self._save_tree_scale(t.hashed_tree_constructor, clamped_scale)
                 t.render()
+            state_manager.refresh_scale_context()
 
             show_scale_notification(clamped_scale)
 
         return clamped_scale
 
     def _save_tree_scale(self, tree_hash: str, scale: float):
-        ui_elements_data = storage.get("ui_elements", {})
-        scale_per_tree = ui_elements_data.get("scale_per_tree", {})
-        scale_per_tree[tree_hash] = scale
-        ui_elements_data["scale_per_tree"] = scale_per_tree
-        storage.set("ui_elements", ui_elements_data)
+        layout_store.set_scale(tree_hash, scale)
 
     def _remove_tree_scale(self, tree_hash: str):
-        ui_elements_data = storage.get("ui_elements", {})
-        scale_per_tree = ui_elements_data.get("scale_per_tree", {})
-        if tree_hash in scale_per_tree:
-            del scale_per_tree[tree_hash]
-            ui_elements_data["scale_per_tree"] = scale_per_tree
-            storage.set("ui_elements", ui_elements_data)
+        layout_store.remove_scale(tree_hash)
 
     def increase_scale(self, increment: float = 0.1, tree: TreeType = None) -> float:
         interactive_trees = [t for t in store.trees if t.interactive_node_list]
@@ -304,10 +308,7 @@ class EntityManager:
             return default_scale
 
     def reset_all_scale_overrides(self) -> float:
-        ui_elements_data = storage.get("ui_elements", {})
-        if "scale_per_tree" in ui_elements_data:
-            ui_elements_data["scale_per_tree"] = {}
-            storage.set("ui_elements", ui_elements_data)
+        layout_store.clear_scales()
 
         default_scale = settings.get("user.ui_elements_scale", 1.0)
         for tree in store.trees:
@@ -0,0 +1,199 @@
+import json
+import os
+from types import MappingProxyType
+from talon import actions, cron, storage
+from talon.types import Point2d, Rect
+
+LAYOUT_STORE_FILE_NAME = "ui_elements_layout.json"
+LAYOUT_STORE_VERSION = 1
+LAYOUT_STORE_WRITE_DELAY = "500ms"
+# Window hashes change with window props, so old entries are pruned
+LAYOUT_STORE_MAX_WINDOWS = 100
+
+WINDOW_GEOMETRY_DEFAULTS = {
+    "last_pos": None,
+    "last_docked_pos": None,
+    "last_pos_drag_offset": None,
+    "last_docked_pos_drag_offset": None,
+    "last_resize_width": None,
+    "last_resize_height": None,
+}
+
+_EMPTY_WINDOW_GEOMETRY = MappingProxyType(WINDOW_GEOMETRY_DEFAULTS)
+
+def _encode(value):
+    if isinstance(value, Rect):
+        return {"rect": [value.x, value.y, value.width, value.height]}
+    if isinstance(value, Point2d):
+        return {"point": [value.x, value.y]}
+    return value
+
+def _decode(value):
+    if isinstance(value, dict):
+        if "rect" in value:
+            return Rect(*value["rect"])
+        if "point" in value:
+            return Point2d(*value["point"])
+    return value
+
+class LayoutStore:
+    """
+    Window geometry (positions, dock positions, drag offsets, resize
+    dimensions) keyed by window hash, and scale overrides keyed by tree
+    hash, kept in memory and persisted to a single JSON file in the Talon
+    home directory.
+
+    Loaded once on first use. Only windows with saved geometry get an
+    entry, kept in least recently used order and pruned beyond
+    LAYOUT_STORE_MAX_WINDOWS. Changes only mark the store dirty and
+    (re)start a debounced write, so a drag, resize or repeated scale
+    change results in one write. The file is replaced atomically, so a
+    crash mid-write leaves the previous layout intact.
+    """
+    def __init__(self):
+        self.windows: dict[str, dict] = {}
+        self.scale_per_tree: dict[str, float] = {}
+        self.path: str = None
+        self.loaded = False
+        self.dirty = False
+        self.write_job = None
+        self.writes = 0
+
+    def _get_path(self) -> str:
+        if self.path is None:
+            self.path = os.path.join(str(actions.path.talon_home()), LAYOUT_STORE_FILE_NAME)
+        return self.path
+
+    def load(self):
+        if self.loaded:
+            return
+        self.loaded = True
+
+        try:
+            path = self._get_path()
+            if not os.path.exists(path):
+                # Scale overrides used to be kept in talon storage
+                self.scale_per_tree = dict(storage.get("ui_elements", {}).get("scale_per_tree", {}))
+                return
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error loading ui_elements layout: {e}")
+            return
+
+        if data.get("version") != LAYOUT_STORE_VERSION:
+            return
+
+        self.scale_per_tree = data.get("scale_per_tree", {})
+        self.windows = {
+            window_hash: {
+                **WINDOW_GEOMETRY_DEFAULTS,
+                **{key: _decode(value) for key, value in geometry.items()},
+            }
+            for window_hash, geometry in data.get("windows", {}).items()
+            if geometry
+        }
+        self.prune_windows()
+
+    def get_window(self, window_hash: str):
+        """
+        Read only geometry for a window, all None if nothing was saved.
+        Use `update_window` to change it.
+        """
+        self.load()
+        geometry = self.windows.get(window_hash)
+        if geometry is None:
+            return _EMPTY_WINDOW_GEOMETRY
+        return MappingProxyType(geometry)
+
+    def update_window(self, window_hash: str, **values):
+        self.load()
+        geometry = self.windows.pop(window_hash, None)
+        if geometry is None:
+            if all(value is None for value in values.values()):
+                return
+            geometry = dict(WINDOW_GEOMETRY_DEFAULTS)
+        # Reinserted as most recently used
+        self.windows[window_hash] = geometry
+        changed = False
+        for key, value in values.items():
+            if geometry.get(key) != value:
+                geometry[key] = value
+                changed = True
+        if changed:
+            self.prune_windows()
+            self.mark_dirty()
+
+    def prune_windows(self):
+        while len(self.windows) > LAYOUT_STORE_MAX_WINDOWS:
+            self.windows.pop(next(iter(self.windows)))
+
+    def get_scale(self, tree_hash: str, default: float) -> float:
+        self.load()
+        return self.scale_per_tree.get(tree_hash, default)
+
+    def set_scale(self, tree_hash: str, scale: float):
+        self.load()
+        if self.scale_per_tree.get(tree_hash) != scale:
+            self.scale_per_tree[tree_hash] = scale
+            self.mark_dirty()
+
+    def remove_scale(self, tree_hash: str):
+        self.load()
+        if tree_hash in self.scale_per_tree:
+            del self.scale_per_tree[tree_hash]
+            self.mark_dirty()
+
+    def clear_scales(self):
+        self.load()
+        if self.scale_per_tree:
+            self.scale_per_tree.clear()
+            self.mark_dirty()
+
+    def mark_dirty(self):
+        self.dirty = True
+        if self.write_job:
+            cron.cancel(self.write_job)
+        self.write_job = cron.after(LAYOUT_STORE_WRITE_DELAY, self.flush)
+
+    def flush(self):
+        if self.write_job:
+            cron.cancel(self.write_job)
+            self.write_job = None
+        if not self.dirty:
+            return
+        self.dirty = False
+
+        data = {
+            "version": LAYOUT_STORE_VERSION,
+            "scale_per_tree": self.scale_per_tree,
+            "windows": {
+                window_hash: {
+                    key: _encode(value)
+                    for key, value in geometry.items()
+                    if value is not None
+                }
+                for window_hash, geometry in self.windows.items()
+                if any(value is not None for value in geometry.values())
+            },
+        }
+
+        path = self._get_path()
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+            self.writes += 1
+        except Exception as e:
+            print(f"Error saving ui_elements layout: {e}")
+
+    def get_stats(self) -> dict:
+        return {
+            "windows": len(self.windows),
+            "scale_overrides": len(self.scale_per_tree),
+            "dirty": self.dirty,
+            "writes": self.writes,
+        }
+
+layout_store = LayoutStore()
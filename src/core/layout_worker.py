@@ -0,0 +1,77 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from talon import cron
+
+# One worker shared by all trees. Layout is pure Python, so more threads
+# wouldn't run in parallel anyway, they would only contend for the GIL.
+_executor: ThreadPoolExecutor = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui_elements_layout")
+    return _executor
+
+class LayoutWorker:
+    """
+    Runs a tree's layout pass on a background thread and hands the result
+    back to the main thread.
+
+    The render manager keeps the render task that started the layout
+    current until the result is committed, so other renders queue up
+    behind it. The tree pauses everything else that touches nodes while
+    `is_busy`: animation ticks and frame callbacks, scroll input and
+    decorator draws wait, and mouse events are queued and replayed after
+    the commit. Text is measured on the main thread before submitting.
+    Results for a superseded or cancelled layout are dropped.
+    """
+    def __init__(self):
+        self.generation = 0
+        self.busy = False
+        self.layouts = 0
+        self.dropped = 0
+        self.last_layout_ms = 0.0
+
+    def submit(self, layout: Callable[[], None], on_done: Callable[[Exception], None]):
+        """`on_done(error)` runs on the main thread, `error` is None on success"""
+        self.generation += 1
+        generation = self.generation
+        self.busy = True
+
+        def run():
+            start = time.perf_counter()
+            error = None
+            try:
+                layout()
+            except Exception as e:
+                error = e
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            cron.after("0ms", lambda: self._finish(generation, on_done, error, elapsed_ms))
+
+        _get_executor().submit(run)
+
+    def _finish(self, generation: int, on_done: Callable[[Exception], None], error: Exception, elapsed_ms: float):
+        if generation != self.generation:
+            self.dropped += 1
+            return
+        self.busy = False
+        self.layouts += 1
+        self.last_layout_ms = elapsed_ms
+        on_done(error)
+
+    def is_busy(self) -> bool:
+        return self.busy
+
+    def cancel(self):
+        if self.busy:
+            self.generation += 1
+            self.busy = False
+
+    def get_stats(self) -> dict:
+        return {
+            "busy": self.busy,
+            "layouts": self.layouts,
+            "dropped": self.dropped,
+            "last_layout_ms": round(self.last_layout_ms, 2),
+        }
@@ -0,0 +1,91 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from ..box_model import BoxModelV2
+from ..interfaces import NodeType, Size2d
+
+NODE_POOL_MAX_PER_TYPE = 256
+
+@dataclass
+class NodePoolStats:
+    hits: int = 0
+    misses: int = 0
+    released: int = 0
+    discarded: int = 0
+
+class NodePool:
+    """
+    Per tree pool of box models, keyed by element type.
+
+    Every layout pass measures every node, and every state change builds
+    a fresh node tree, which used to mean a new BoxModelV2 per node per
+    pass. Box models are instead reset in place via `BoxModelV2.reset`:
+    a node re-measured in a later pass reuses its own instance, and the
+    box models of a node tree replaced by a re-render are released here
+    for the new nodes of the same element type.
+    """
+    def __init__(self):
+        self.free: dict[str, list[BoxModelV2]] = defaultdict(list)
+        self.stats = NodePoolStats()
+
+    def acquire_box_model(
+        self,
+        node: NodeType,
+        content_size: Size2d = Size2d(0, 0),
+    ) -> BoxModelV2:
+        box_model = node.box_model
+        if box_model is None:
+            free = self.free.get(node.element_type)
+            box_model = free.pop() if free else None
+
+        if box_model is None:
+            self.stats.misses += 1
+            return BoxModelV2(
+                node.properties,
+                content_size,
+                node.clip_nodes,
+                node.relative_positional_node
+            )
+
+        self.stats.hits += 1
+        box_model.reset(
+            node.properties,
+            content_size,
+            node.clip_nodes,
+            node.relative_positional_node
+        )
+        return box_model
+
+    def release(self, node: NodeType):
+        """Release the box models of a node tree that is no longer rendered"""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children_nodes)
+            if node.get_children_nodes() is not node.children_nodes:
+                # e.g. table column layout nodes
+                stack.extend(node.get_children_nodes())
+            box_model = node.box_model
+            if box_model is None:
+                continue
+            box_model.gc()
+            node.box_model = None
+            free = self.free[node.element_type]
+            if len(free) < NODE_POOL_MAX_PER_TYPE:
+                free.append(box_model)
+                self.stats.released += 1
+            else:
+                self.stats.discarded += 1
+
+    def get_stats(self) -> dict:
+        acquired = self.stats.hits + self.stats.misses
+        return {
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_rate": round(self.stats.hits / acquired, 3) if acquired else 0,
+            "released": self.stats.released,
+            "discarded": self.stats.discarded,
+            "free": sum(len(free) for free in self.free.values()),
+        }
+
+    def clear(self):
+        self.free.clear()
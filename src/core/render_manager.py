@@ -22,6 +22,7 @@ class RenderCause(Enum):
     REQUEST_ANIMATION_FRAME = "REQUEST_ANIMATION_FRAME"
     CURSOR_UPDATE = "CURSOR_UPDATE"
     RESIZE_GHOST = "RESIZE_GHOST"
+    RESIZE_LAYOUT = "RESIZE_LAYOUT"
 
 class Policy(Enum):
     TAKE_LATEST = "take_latest"
@@ -114,6 +115,11 @@ RenderTaskResizeGhost = RenderTask(
     on_decorator_canvas_change,
 )
 
+RenderTaskResizeLayout = RenderTask(
+    RenderCause.RESIZE_LAYOUT,
+    on_base_canvas_change,
+)
+
 @dataclass
 class RenderCallbackEvent:
     tree: TreeType = None
@@ -156,7 +162,8 @@ class RenderManager(RenderManagerType):
                     render_task.cause == RenderCause.DRAG_START or \
                     render_task.cause == RenderCause.DRAG_END or \
                     render_task.cause == RenderCause.SCROLLBAR_DRAGGING or \
-                    render_task.cause == RenderCause.RESIZE_GHOST):
+                    render_task.cause == RenderCause.RESIZE_GHOST or \
+                    render_task.cause == RenderCause.RESIZE_LAYOUT):
                 return
             if not self.current_render_task:
                 self.current_render_task = render_task
@@ -188,6 +195,10 @@ class RenderManager(RenderManagerType):
         return self.current_render_task and \
             self.current_render_task.cause == RenderCause.CURSOR_UPDATE
 
+    def is_resize_layout(self):
+        return self.current_render_task and \
+            self.current_render_task.cause == RenderCause.RESIZE_LAYOUT
+
     def _queue_render_after_debounce(self, interval: str, render_task: RenderTask):
         if self._render_debounce_job:
             cron.cancel(self._render_debounce_job)
@@ -220,7 +231,8 @@ class RenderManager(RenderManagerType):
                         self.queue[0].cause == RenderCause.DRAG_START or \
                         self.queue[0].cause == RenderCause.DRAG_END or \
                         self.queue[0].cause == RenderCause.SCROLLBAR_DRAGGING or \
-                        self.queue[0].cause == RenderCause.RESIZE_GHOST):
+                        self.queue[0].cause == RenderCause.RESIZE_GHOST or \
+                        self.queue[0].cause == RenderCause.RESIZE_LAYOUT):
                     return
             self.current_render_task = self.queue.popleft()
             self.current_render_task.on_start(self.tree, *self.current_render_task.args)
@@ -323,7 +335,11 @@ class RenderManager(RenderManagerType):
         self._render_throttle("10ms", render_task)
 
     def render_scroll(self):
-        self._render_throttle("16ms", RenderTaskScrolling)
+        # Deltas are already coalesced per frame by ScrollInput, so never
+        # drop a scroll render, just don't queue a second one.
+        if RenderTaskScrolling in self.queue:
+            return
+        self.queue_render(RenderTaskScrolling)
 
     def render_scrollbar_dragging(self):
         self._render_throttle("16ms", RenderTaskScrollbarDragging)
@@ -337,6 +353,10 @@ class RenderManager(RenderManagerType):
     def render_resize_ghost(self):
         self._render_throttle("16ms", RenderTaskResizeGhost)
 
+    def render_resize_layout(self):
+        if RenderTaskResizeLayout not in self.queue:
+            self.queue_render(RenderTaskResizeLayout)
+
     def render_cursor_update(self):
         self._render_throttle("10ms", RenderTaskCursorUpdate)
 
@@ -0,0 +1,82 @@
+import time
+from collections import defaultdict, deque
+from typing import Callable
+from talon import cron
+
+WAKEUP_WINDOW = 1.0
+
+class Scheduler:
+    """
+    Timers for a tree.
+
+    Jobs are keyed by name, and scheduling a name that is still pending
+    replaces it, so each purpose (hover validation, cursor refresh,
+    animation tick, ...) has at most one outstanding job. Every callback
+    run is counted as a wakeup, so an idle tree should show no periodic
+    jobs and no wakeups in `get_stats`.
+    """
+    def __init__(self):
+        self.jobs: dict[str, object] = {}
+        self.periodic: set[str] = set()
+        self.wakeups: dict[str, deque[float]] = defaultdict(deque)
+        self.total_wakeups = 0
+
+    def after(self, name: str, delay: str, callback: Callable[[], None]):
+        self.cancel(name)
+
+        def run():
+            self.jobs.pop(name, None)
+            self._record_wakeup(name)
+            callback()
+
+        self.jobs[name] = cron.after(delay, run)
+
+    def interval(self, name: str, interval: str, callback: Callable[[], None]):
+        self.cancel(name)
+
+        def run():
+            self._record_wakeup(name)
+            callback()
+
+        self.jobs[name] = cron.interval(interval, run)
+        self.periodic.add(name)
+
+    def cancel(self, name: str):
+        job = self.jobs.pop(name, None)
+        self.periodic.discard(name)
+        if job:
+            cron.cancel(job)
+
+    def is_scheduled(self, name: str) -> bool:
+        return name in self.jobs
+
+    def is_idle(self) -> bool:
+        return not self.periodic
+
+    def _record_wakeup(self, name: str):
+        now = time.monotonic()
+        wakeups = self.wakeups[name]
+        wakeups.append(now)
+        while now - wakeups[0] > WAKEUP_WINDOW:
+            wakeups.popleft()
+        self.total_wakeups += 1
+
+    def get_wakeups_per_second(self) -> dict[str, int]:
+        now = time.monotonic()
+        return {
+            name: sum(1 for t in wakeups if now - t <= WAKEUP_WINDOW)
+            for name, wakeups in self.wakeups.items()
+        }
+
+    def get_stats(self) -> dict:
+        return {
+            "outstanding": sorted(self.jobs),
+            "periodic": sorted(self.periodic),
+            "wakeups_per_second": self.get_wakeups_per_second(),
+            "total_wakeups": self.total_wakeups,
+        }
+
+    def destroy(self):
+        for name in list(self.jobs):
+            self.cancel(name)
+        self.wakeups.clear()
@@ -0,0 +1,165 @@
+from dataclasses import dataclass
+from talon import settings
+from ..interfaces import TreeType
+
+SCROLL_FRAME_INTERVAL = "16ms"
+SCROLL_SMOOTH_FACTOR = 0.35
+SCROLL_SMOOTH_SNAP = 0.5
+
+@dataclass
+class ScrollInputStats:
+    received: int = 0
+    applied: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    frames: int = 0
+
+class PendingScroll:
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.count = 0
+
+class ScrollInput:
+    """
+    Scroll input pipeline for a tree.
+
+    Wheel and touchpad events are accumulated per scrollable and applied
+    once per frame, so bursts of events cost a single scroll render.
+    With `ui_elements_scroll_smooth` enabled, the applied offset glides
+    toward its target on the animation tick instead of jumping.
+
+    Events that could not move anything (e.g. already at the edge) are
+    counted as dropped, the rest as applied.
+    """
+    def __init__(self, tree: TreeType):
+        self.tree = tree
+        self.pending: dict[str, PendingScroll] = {}
+        self.targets: dict[str, list[float]] = {}
+        self.smooth = settings.get("user.ui_elements_scroll_smooth", False)
+        self.stats = ScrollInputStats()
+
+    def add(self, id: str, offset_x: float, offset_y: float):
+        self.stats.received += 1
+        pending = self.pending.get(id)
+        if pending:
+            self.stats.coalesced += 1
+        else:
+            pending = self.pending[id] = PendingScroll()
+        pending.x += offset_x
+        pending.y += offset_y
+        pending.count += 1
+
+        if not self.tree.scheduler.is_scheduled("scroll_frame"):
+            # Leading edge applies immediately, anything arriving during
+            # the frame is applied together on the trailing edge.
+            self.flush()
+            self.tree.scheduler.after("scroll_frame", SCROLL_FRAME_INTERVAL, self.on_frame_end)
+
+    def on_frame_end(self):
+        if self.pending and self.tree and not self.tree.destroying:
+            self.flush()
+            self.tree.scheduler.after("scroll_frame", SCROLL_FRAME_INTERVAL, self.on_frame_end)
+
+    def _clamp(self, scrollable, x: float, y: float) -> tuple[float, float]:
+        x = max(scrollable.view_width - scrollable.max_width, min(0, x)) \
+            if scrollable.max_width > scrollable.view_width else scrollable.offset_x
+        y = max(scrollable.view_height - scrollable.max_height, min(0, y)) \
+            if scrollable.max_height > scrollable.view_height else scrollable.offset_y
+        return x, y
+
+    def flush(self):
+        """Apply all pending deltas, at most one scroll render per call"""
+        if self.tree.layout_worker.is_busy():
+            # Kept pending, the next frame applies them to the new layout
+            return
+
+        did_scroll = False
+        did_retarget = False
+
+        for id, pending in self.pending.items():
+            scrollable = self.tree.meta_state.scrollable.get(id)
+            if not scrollable:
+                self.stats.dropped += pending.count
+                continue
+
+            if self.smooth:
+                start_x, start_y = self.targets.get(id, (scrollable.offset_x, scrollable.offset_y))
+                target = self._clamp(scrollable, start_x + pending.x, start_y + pending.y)
+                if target == (start_x, start_y):
+                    self.stats.dropped += pending.count
+                    continue
+                self.targets[id] = list(target)
+                did_retarget = True
+            else:
+                new_x, new_y = self._clamp(
+                    scrollable,
+                    scrollable.offset_x + pending.x,
+                    scrollable.offset_y + pending.y
+                )
+                if new_x == scrollable.offset_x and new_y == scrollable.offset_y:
+                    self.stats.dropped += pending.count
+                    continue
+                scrollable.offset_x = new_x
+                scrollable.offset_y = new_y
+                did_scroll = True
+
+            self.stats.applied += pending.count
+
+        self.pending.clear()
+
+        if did_retarget:
+            self.tree.transition_manager.add_frame_callback(self.step)
+        elif did_scroll:
+            self.stats.frames += 1
+            self.tree.render_manager.render_scroll()
+
+    def step(self) -> bool:
+        """Glide toward smooth scroll targets. Returns True while still moving."""
+        if not self.tree or self.tree.destroying:
+            self.targets.clear()
+            return False
+
+        for id, target in list(self.targets.items()):
+            scrollable = self.tree.meta_state.scrollable.get(id)
+            if not scrollable:
+                del self.targets[id]
+                continue
+
+            delta_x = target[0] - scrollable.offset_x
+            delta_y = target[1] - scrollable.offset_y
+            if abs(delta_x) <= SCROLL_SMOOTH_SNAP and abs(delta_y) <= SCROLL_SMOOTH_SNAP:
+                scrollable.offset_x, scrollable.offset_y = target
+                del self.targets[id]
+            else:
+                scrollable.offset_x += delta_x * SCROLL_SMOOTH_FACTOR
+                scrollable.offset_y += delta_y * SCROLL_SMOOTH_FACTOR
+
+        self.stats.frames += 1
+        self.tree.render_manager.render_scroll()
+        return bool(self.targets)
+
+    def cancel(self, id: str):
+        """Drop pending input and any glide for `id`, e.g. when the scrollbar is grabbed"""
+        self.pending.pop(id, None)
+        self.targets.pop(id, None)
+
+    def is_idle(self) -> bool:
+        return not self.pending and not self.targets \
+            and not (self.tree and self.tree.scheduler.is_scheduled("scroll_frame"))
+
+    def get_stats(self) -> dict:
+        return {
+            "received": self.stats.received,
+            "applied": self.stats.applied,
+            "dropped": self.stats.dropped,
+            "coalesced": self.stats.coalesced,
+            "frames": self.stats.frames,
+        }
+
+    def destroy(self):
+        if self.tree:
+            self.tree.scheduler.cancel("scroll_frame")
+        self.pending.clear()
+        self.targets.clear()
+        self.tree = None
@@ -7,6 +7,7 @@ from ..interfaces import (
     StyleType,
     TreeType,
 )
+from .layout_store import layout_store
 from .store import store
 import gc
 
@@ -214,6 +215,11 @@ class StateManager:
                 store.processing_tree_stack.pop()
         else:
             store.processing_tree_stack.append(tree)
+        self.refresh_scale_context()
+
+    def refresh_scale_context(self):
+        tree = self.get_processing_tree()
+        store.scale_context = getattr(tree, 'scale', None) if tree else None
 
     def get_processing_style(self) -> StyleType:
         context = state_manager.get_processing_component() \
@@ -498,6 +504,9 @@ class StateManager:
                 scroll_data.offset_x = x
                 node.tree.render()
 
+    def is_tracking_ref_counts(self):
+        return store.track_ref_counts
+
     def increment_ref_count_nodes(self):
         store.ref_count_nodes += 1
 
@@ -550,6 +559,8 @@ class StateManager:
             state_coordinator.reset()
 
     def clear_tree(self, tree: TreeType):
+        # Don't leave the tree's last drag or resize to the debounced write
+        layout_store.flush()
         if tree in store.trees:
             store.root_nodes = [node for node in store.root_nodes if node.tree != tree]
             store.trees.remove(tree)
@@ -558,13 +569,28 @@ class StateManager:
         store.mouse_state['disable_events'] = False
         if not store.trees:
             from .. import fonts
+            from ..border_radius import clear_rounded_rect_path_cache
+            from ..paints import paint_registry
+            from ..shadow_cache import shadow_cache
+            from ..nodes.node_svg import clear_svg_geometry_cache
             fonts.reset_font_state()
+            paint_registry.clear()
+            shadow_cache.clear()
+            clear_rounded_rect_path_cache()
+            clear_svg_geometry_cache()
 
     def clear_all(self):
         from .. import fonts
+        from ..paints import paint_registry
+        from ..shadow_cache import shadow_cache
+        from ..nodes.node_svg import clear_svg_geometry_cache
+        layout_store.flush()
         store.clear()
         state_coordinator.reset()
         fonts.reset_font_state()
+        paint_registry.clear()
+        shadow_cache.clear()
+        clear_svg_geometry_cache()
 
     def deprecated_event_register_on_lifecycle(self, callback):
         if callback not in _deprecated_event_subscribers:
@@ -588,7 +614,10 @@ state_manager = StateManager()
 
 def debug_gc():
     gc.collect()
-    print("gc actual nodes:", state_manager.get_ref_count_nodes())
+    if state_manager.is_tracking_ref_counts():
+        print("gc actual nodes:", state_manager.get_ref_count_nodes())
+    else:
+        print("gc actual nodes: not tracked, enable user.ui_elements_debug_ref_counts")
     print("gc actual trees:", state_manager.get_ref_count_trees())
     print("Store nodes with ids:", len(store.id_to_node.keys()))
     print("Store trees:", len(store.trees))
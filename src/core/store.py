@@ -30,8 +30,10 @@ class Store():
         self.reactive_state: dict[str, ReactiveStateType] = {}
         self.staged_effects: list[Effect] = []
         self.ref_count_nodes = 0
+        self.track_ref_counts = False
         self.ref_count_trees = 0
         self.scale: float = 1.0  # UI scale, initialized from settings per tree
+        self.scale_context: Optional[float] = None  # scale of the processing tree
         self.mouse_state: MouseState = {
             "disable_events": False,
             "hovered_id": None,
@@ -68,6 +70,7 @@ class Store():
         self.focused_visible = None
         self.pause_renders = False
         self.processing_tree_stack = []
+        self.scale_context = None
         self.processing_components = {}
         self.processing_states.clear()
         self.root_nodes = []
@@ -0,0 +1,53 @@
+import math
+from talon.types import Rect
+from .shadow_cache import get_shadow_margin
+
+def get_paint_bounds(node) -> Rect:
+    """Rect a node can paint into, including its drop shadow. None before layout"""
+    box_model = node.box_model
+    if not box_model:
+        return None
+    rect = box_model.margin_rect
+    drop_shadow = getattr(node.properties, "drop_shadow", None)
+    if drop_shadow:
+        margin = get_shadow_margin(tuple(drop_shadow))
+        rect = Rect(rect.x - margin, rect.y - margin, rect.width + margin * 2, rect.height + margin * 2)
+    return rect
+
+def rects_intersect(a: Rect, b: Rect) -> bool:
+    return a.x < b.x + b.width and b.x < a.x + a.width \
+        and a.y < b.y + b.height and b.y < a.y + a.height
+
+class DamageRegion:
+    """
+    Accumulated dirty area for a partial repaint, kept as the bounding
+    union of the added rects, snapped out to whole pixels.
+    """
+    def __init__(self):
+        self.rect: Rect = None
+
+    def add(self, rect: Rect):
+        if not rect or rect.width <= 0 or rect.height <= 0:
+            return
+        if self.rect is None:
+            left, top = rect.x, rect.y
+            right, bottom = rect.x + rect.width, rect.y + rect.height
+        else:
+            left = min(self.rect.x, rect.x)
+            top = min(self.rect.y, rect.y)
+            right = max(self.rect.x + self.rect.width, rect.x + rect.width)
+            bottom = max(self.rect.y + self.rect.height, rect.y + rect.height)
+        left, top = math.floor(left), math.floor(top)
+        self.rect = Rect(left, top, math.ceil(right) - left, math.ceil(bottom) - top)
+
+    def add_subtree(self, node):
+        """Damage a node and everything it contains, e.g. for inherited opacity"""
+        self.add(get_paint_bounds(node))
+        for child in node.get_children_nodes():
+            self.add_subtree(child)
+
+    def intersects(self, rect: Rect) -> bool:
+        return self.rect is not None and rect is not None and rects_intersect(self.rect, rect)
+
+    def is_empty(self) -> bool:
+        return self.rect is None
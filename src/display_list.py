@@ -0,0 +1,139 @@
+from talon.skia.canvas import Canvas as SkiaCanvas
+from talon.skia.paint import Paint
+from talon.types import Point2d
+from .node_geometry import translate_start
+
+DISPLAY_LIST_STATE_OPS = frozenset((
+    "save",
+    "restore",
+    "translate",
+    "clip_rect",
+    "clip_rrect",
+    "clip_path",
+))
+
+DISPLAY_LIST_DRAW_OPS = frozenset((
+    "draw_rect",
+    "draw_rrect",
+    "draw_round_rect",
+    "draw_path",
+    "draw_text",
+    "draw_line",
+    "draw_circle",
+    "draw_image",
+    "draw_points",
+))
+
+class DisplayList:
+    """
+    Flat list of canvas ops for the base canvas, recorded once after
+    layout from the render layers and replayed to any canvas.
+
+    Each op is (item index, method name, args, kwargs, paint). `paint` is
+    a snapshot of the canvas paint for draws that didn't pass one, else
+    None. `items` holds the render item for each item index, and `spans`
+    the (start, end) range of its ops, so single items can be re-recorded
+    and replayed.
+    """
+    __slots__ = ("ops", "items", "spans")
+
+    def __init__(self):
+        self.ops: list[tuple[int, str, tuple, dict, Paint]] = []
+        self.items: list = []
+        self.spans: list[tuple[int, int]] = []
+
+    def rerecord(self, indices: set[int]):
+        """Re-records the given items, e.g. after their paint properties changed"""
+        if not indices:
+            return
+        recorder = DisplayListRecorder()
+        ops = []
+        for index, item in enumerate(self.items):
+            start, end = self.spans[index]
+            new_start = len(ops)
+            if index in indices:
+                ops.extend(recorder.record(index, item))
+            else:
+                ops.extend(self.ops[start:end])
+            self.spans[index] = (new_start, len(ops))
+        self.ops = ops
+
+    def replay_items(self, c, indices: set[int]):
+        """
+        Replays draws of the given items only. Save, restore, translate and
+        clip ops of every item still run, since items can open a clip that
+        a later item closes.
+        """
+        canvas_paint = c.paint
+        for item, name, args, kwargs, paint in self.ops:
+            if item not in indices and name in DISPLAY_LIST_DRAW_OPS:
+                continue
+            if paint is not None:
+                c.paint = paint
+            getattr(c, name)(*args, **kwargs)
+        c.paint = canvas_paint
+
+    def replay(self, c, offset: Point2d = None):
+        canvas_paint = c.paint
+        translated = translate_start(c, offset)
+        for _, name, args, kwargs, paint in self.ops:
+            if paint is not None:
+                c.paint = paint
+            getattr(c, name)(*args, **kwargs)
+        if translated:
+            c.restore()
+        c.paint = canvas_paint
+
+    def __len__(self):
+        return len(self.ops)
+
+class DisplayListRecorder:
+    """
+    Canvas stand-in passed to render items instead of a real canvas.
+    Supported canvas calls are recorded instead of drawn, `paint` is a
+    real Paint so render code can configure it as usual.
+    """
+    PointMode = SkiaCanvas.PointMode
+
+    def __init__(self):
+        self.paint = Paint()
+        self.ops: list[tuple[int, str, tuple, dict, Paint]] = []
+        self.item = -1
+
+    def record(self, index: int, item) -> list[tuple[int, str, tuple, dict, Paint]]:
+        """Ops of one render item"""
+        self.item = index
+        self.ops = []
+        item.draw(self)
+        return self.ops
+
+    def _record(self, name: str, args: tuple, kwargs: dict):
+        paint = None
+        if name in DISPLAY_LIST_DRAW_OPS:
+            if any(isinstance(arg, Paint) for arg in args) \
+                    or any(isinstance(arg, Paint) for arg in kwargs.values()):
+                # Shared registry paints are immutable, the canvas paint isn't
+                args = tuple(arg.clone() if arg is self.paint else arg for arg in args)
+                kwargs = {
+                    key: arg.clone() if arg is self.paint else arg
+                    for key, arg in kwargs.items()
+                }
+            else:
+                paint = self.paint.clone()
+        self.ops.append((self.item, name, args, kwargs, paint))
+
+    def __getattr__(self, name: str):
+        if name in DISPLAY_LIST_DRAW_OPS or name in DISPLAY_LIST_STATE_OPS:
+            return lambda *args, **kwargs: self._record(name, args, kwargs)
+        raise AttributeError(f"DisplayListRecorder doesn't support '{name}'")
+
+def record_display_list(items: list) -> DisplayList:
+    """Records render items, in draw order, into a new display list"""
+    recorder = DisplayListRecorder()
+    display_list = DisplayList()
+    for index, item in enumerate(items):
+        start = len(display_list.ops)
+        display_list.ops.extend(recorder.record(index, item))
+        display_list.items.append(item)
+        display_list.spans.append((start, len(display_list.ops)))
+    return display_list
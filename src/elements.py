@@ -50,7 +50,7 @@ from .properties import (
 )
 from .icons import icon
 from .ref import Ref
-from .style import Style
+from .style import get_style
 
 def screen(*args, **additional_props):
     """
@@ -182,7 +182,7 @@ def style(style_dict: dict[str, Any]):
     context = state_manager.get_processing_component() \
         or state_manager.get_processing_tree()
     if context:
-        context.style = Style(style_dict)
+        context.style = get_style(style_dict)
 
 def div(props=None, **additional_props):
     properties = validate_combined_props(props, additional_props, ELEMENT_ENUM_TYPE["div"])
@@ -1,5 +1,7 @@
-from talon import actions
+from talon import actions, settings
 from .constants import ELEMENT_ENUM_TYPE
+from .nodes.node_svg import NodeSvgIcon
+from .properties import NodeSvgProperties
 from .properties import validate_combined_props
 
 # Use for references:
@@ -302,6 +304,20 @@ def icon_svg_single_path_stroke(name: str, props=None, **additional_props):
         ]
     ]
 
+def icon_svg_single_path_raster(name: str, props=None, **additional_props):
+    div_props, svg_props = parse_icon_properties(props, **additional_props)
+
+    paths = ICON_SVG_PATH_ONLY[name] if isinstance(ICON_SVG_PATH_ONLY[name], list) else [ICON_SVG_PATH_ONLY[name]]
+
+    validated_props = validate_combined_props(svg_props, {}, ELEMENT_ENUM_TYPE["svg"])
+    icon_node = NodeSvgIcon(name, paths, NodeSvgProperties(**validated_props))
+
+    if not div_props:
+        return icon_node
+
+    div = actions.user.ui_elements("div")
+    return div(**div_props)[icon_node]
+
 def icon(name: str, props=None, **additional_props):
     default_props = {
         "name": name,
@@ -314,6 +330,8 @@ def icon(name: str, props=None, **additional_props):
     validate_combined_props(default_props, additional_props, ELEMENT_ENUM_TYPE["icon"])
 
     if name in ICON_SVG_PATH_ONLY:
+        if settings.get("user.ui_elements_icon_raster", False):
+            return icon_svg_single_path_raster(name, props, **additional_props)
         return icon_svg_single_path_stroke(name, props, **additional_props)
     if name in ICON_CUSTOM_SVG:
         return ICON_CUSTOM_SVG[name](props, **additional_props)
\ No newline at end of file
@@ -176,11 +176,21 @@ class ScrollableType(ABC):
     max_height: Union[int, float]
     view_width: Union[int, float]
     max_width: Union[int, float]
+    layout_offset_x: Union[int, float]
+    layout_offset_y: Union[int, float]
 
     @abstractmethod
     def reevaluate(self, node: "NodeType"):
         pass
 
+    @abstractmethod
+    def get_layout_delta(self) -> Point2d:
+        pass
+
+    @abstractmethod
+    def commit_layout_offset(self):
+        pass
+
 @dataclass
 class MetaStateInput:
     value: str
@@ -476,6 +486,7 @@ class BoxModelV2Type(ABC):
 class NodeType(ABC):
     properties: PropertiesType
     cascaded_properties: set[str]
+    cascade: Any
     guid: str
     id: str
     key: str
@@ -807,7 +818,7 @@ class TreeType(ABC):
     draggable_node: NodeType
     draggable_node_delta_pos: Point2d
     drag_handle_node: NodeType
-    effects: List[Effect]
+    effects: dict[int, Effect]
     meta_state: MetaStateType
     name: str
     processing_states: set[str]
@@ -0,0 +1,101 @@
+from talon.skia import RoundRect
+from talon.skia.canvas import Canvas as SkiaCanvas
+from talon.types import Rect, Point2d
+from talon.skia.paint import Paint
+from .border_radius import BorderRadius, draw_manual_rounded_rect_path
+from .paints import paint_registry
+
+class RectShape:
+    """A rect, rrect or path prepared once, see `utils.draw_rect`"""
+    __slots__ = ("rect", "rrect", "path")
+
+    def __init__(self, rect: Rect, border_radius: BorderRadius = None):
+        self.rect = rect
+        self.rrect = None
+        self.path = None
+        if border_radius and border_radius.has_radius():
+            if border_radius.is_uniform():
+                self.rrect = RoundRect.from_rect(rect, x=border_radius.top_left, y=border_radius.top_left)
+            else:
+                self.path = draw_manual_rounded_rect_path(rect, border_radius)
+
+    def draw(self, c: SkiaCanvas, paint: Paint):
+        if self.path:
+            c.draw_path(self.path, paint)
+        elif self.rrect:
+            c.draw_rrect(self.rrect, paint)
+        else:
+            c.draw_rect(self.rect, paint)
+
+class NodeGeometry:
+    """
+    Background, drop shadow and border primitives for a node, in layout
+    coordinates. Built once after layout and reused across frames until
+    the padding rect (a new object after any geometry change), border
+    widths or border radius change. Offsets are applied by translating.
+    """
+    def __init__(self, padding_rect: Rect, border_rect: Rect, key: tuple, border_radius: BorderRadius):
+        self.padding_rect = padding_rect
+        self.border_rect = border_rect
+        self.key = key
+        border_top, border_right, border_bottom, border_left = key[:4]
+
+        self.fill = RectShape(padding_rect, border_radius)
+        self.has_border = bool(border_top or border_right or border_bottom or border_left)
+        self.is_uniform_border = border_top == border_right == border_bottom == border_left
+        self.border: RectShape = None
+        self.border_width = border_left
+        self.border_lines: list[tuple[float, float, float, float, float]] = []
+
+        if not self.has_border:
+            return
+
+        if self.is_uniform_border:
+            half = border_left / 2
+            bordered_rect = Rect(
+                padding_rect.x - half,
+                padding_rect.y - half,
+                padding_rect.width + border_left,
+                padding_rect.height + border_left,
+            )
+            # Adjust border radius for the stroke offset
+            adjusted_radius = BorderRadius((
+                border_radius.top_left + half,
+                border_radius.top_right + half,
+                border_radius.bottom_right + half,
+                border_radius.bottom_left + half
+            )) if border_radius.has_radius() else None
+            self.border = RectShape(bordered_rect, adjusted_radius)
+        else:
+            b_rect, p_rect = border_rect, padding_rect
+            if border_left:
+                half = border_left / 2
+                self.border_lines.append((border_left, b_rect.x + half, p_rect.y, b_rect.x + half, p_rect.y + p_rect.height))
+            if border_right:
+                half = border_right / 2
+                self.border_lines.append((border_right, b_rect.x + b_rect.width - half, p_rect.y, b_rect.x + b_rect.width - half, p_rect.y + p_rect.height))
+            if border_top:
+                half = border_top / 2
+                self.border_lines.append((border_top, p_rect.x, b_rect.y + half, p_rect.x + p_rect.width, b_rect.y + half))
+            if border_bottom:
+                half = border_bottom / 2
+                self.border_lines.append((border_bottom, p_rect.x, b_rect.y + b_rect.height - half, p_rect.x + p_rect.width, b_rect.y + b_rect.height - half))
+
+    def matches(self, padding_rect: Rect, border_rect: Rect, key: tuple) -> bool:
+        return self.padding_rect is padding_rect \
+            and self.border_rect is border_rect \
+            and self.key == key
+
+    def draw_border(self, c: SkiaCanvas, color: str):
+        if self.border:
+            self.border.draw(c, paint_registry.get(color, stroke_width=self.border_width))
+        else:
+            for stroke_width, x0, y0, x1, y1 in self.border_lines:
+                c.draw_line(x0, y0, x1, y1, paint_registry.get(color, stroke_width=stroke_width))
+
+def translate_start(c: SkiaCanvas, offset: Point2d) -> bool:
+    if offset and (offset.x or offset.y):
+        c.save()
+        c.translate(offset.x, offset.y)
+        return True
+    return False
@@ -1,8 +1,8 @@
-import inspect
 import weakref
 from typing import List
 from ..core.state_manager import state_manager
 from ..style import Style
+from ..utils import get_param_count
 from ..interfaces import NodeType, TreeType, ComponentType
 
 class Component(ComponentType):
@@ -58,8 +58,7 @@ class Component(ComponentType):
         self.id = (self.name, tuple(node_index_path))
         state_manager.set_processing_component(self)
         # TODO: pass props to the renderer
-        sig = inspect.signature(self.renderer)
-        if len(sig.parameters) == 0:
+        if get_param_count(self.renderer) == 0:
             node_tree = self.renderer()
         else:
             node_tree = self.renderer(self.props)
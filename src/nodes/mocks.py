@@ -1,3 +1,4 @@
+from talon.skia.canvas import Canvas as SkiaCanvas
 from .tree import Tree
 
 class DotDict:
@@ -15,6 +16,8 @@ class DotDict:
         self._values[name] = value
 
 class MockCanvas:
+    PointMode = SkiaCanvas.PointMode
+
     def __init__(self, *args, **kwargs):
         self.log = []
         self.rect = kwargs.get("rect", None)
@@ -1,13 +1,15 @@
-import uuid
+import itertools
 import weakref
 from typing import Union, Optional
-from talon.types import Rect, Point2d
+from talon.types import Point2d
 from talon.skia import RoundRect
 from talon.skia.canvas import Canvas as SkiaCanvas
-from talon.skia.imagefilter import ImageFilter
 from .component import Component
-from ..utils import draw_rect
-from ..border_radius import BorderRadius
+from ..cascade import CascadedStyle
+from ..clip_region import ClipRegion
+from ..node_geometry import NodeGeometry, translate_start
+from ..paints import paint_registry
+from ..shadow_cache import shadow_cache
 from ..core.animations import (
     ANIMATABLE_COLOR_PROPERTIES,
     ANIMATABLE_BORDER_RADIUS,
@@ -36,6 +38,9 @@ from ..interfaces import (
 from ..properties import Properties
 from ..utils import sanitize_string
 
+# Process wide, so guids stay unique across trees (used as builder ids)
+_guid_counter = itertools.count(1)
+
 STYLE_MAP = {
     "highlight": "highlight_style",
     "disabled": "disabled_style",
@@ -51,10 +56,12 @@ class Node(NodeType):
         ):
         self.properties: Properties = properties or Properties()
         self.cascaded_properties = set()
-        self.guid: str = uuid.uuid4().hex
+        self.cascade: CascadedStyle = None
+        self.guid: str = f"n{next(_guid_counter):x}"
         self.class_name: str = None
         self.id: str = sanitize_string(self.properties.id) if self.properties.id else None
         self.is_uniform_border = True
+        self.geometry: NodeGeometry = None
         self.key: str = self.properties.key
         self.node_type: NodeEnumType = NODE_TYPE_MAP[element_type]
         self.element_type: ElementEnumType = element_type
@@ -82,16 +89,16 @@ class Node(NodeType):
         self._parent_node: Optional[weakref.ReferenceType[NodeType]] = None
         self._constraint_nodes: list[weakref.ReferenceType[NodeType]] = []
         self.clip_nodes: list[weakref.ReferenceType[NodeType]] = []
-        self.clip_regions_cache: list = None
+        self.clip_region: ClipRegion = None
+        self.clip_regions_cache: ClipRegion = None
         self.relative_positional_node: weakref.ReferenceType[NodeType] = None
 
         if self.properties.position == "fixed":
            self.v2_reposition = self._v2_no_reposition
 
-        state_manager.increment_ref_count_nodes()
-
-    def __del__(self):
-        state_manager.decrement_ref_count_nodes()
+        if state_manager.is_tracking_ref_counts():
+            state_manager.increment_ref_count_nodes()
+            weakref.finalize(self, state_manager.decrement_ref_count_nodes)
 
     @property
     def tree(self) -> Optional[TreeType]:
@@ -144,20 +151,19 @@ class Node(NodeType):
     def clear_clip_nodes(self):
         self.clip_nodes.clear()
 
-    def compute_clip_regions_cache(self):
-        """Pre-compute clip regions after layout for efficient rendering."""
-        clip_regions = []
+    def compute_clip_regions_cache(self, clip_region: ClipRegion = None):
+        """
+        Pre-compute clip regions after layout for efficient rendering.
 
-        # Add ancestor clip boundaries
-        if self.clip_nodes:
-            for clip_ref in self.clip_nodes:
-                clip_node = clip_ref()
-                if clip_node and clip_node.box_model:
-                    rect = clip_node.box_model.padding_rect
-                    border_radius = clip_node.properties.get_border_radius() if clip_node.properties.has_border_radius() else None
-                    clip_regions.append((rect, border_radius))
+        `clip_region` is the flattened region of `clip_nodes` (ancestors),
+        shared between nodes with the same clip chain. `clip_regions_cache`
+        additionally includes self clipping, used by crop start/end.
+        """
+        if clip_region is None and self.clip_nodes:
+            clip_region = ClipRegion.from_clip_nodes(self.clip_nodes)
+        self.clip_region = clip_region
 
-        # Add self clipping if needed
+        needs_self_clip = False
         if self.box_model:
             needs_self_clip = (
                 self.properties.overflow.scrollable or
@@ -167,12 +173,14 @@ class Node(NodeType):
                 self.properties.has_border_radius()
             )
 
-            if needs_self_clip:
-                rect = self.box_model.padding_rect
-                border_radius = self.properties.get_border_radius() if self.properties.has_border_radius() else None
-                clip_regions.append((rect, border_radius))
-
-        self.clip_regions_cache = clip_regions if clip_regions else None
+        if needs_self_clip:
+            rect = self.box_model.padding_rect
+            border_radius = self.properties.get_border_radius() if self.properties.has_border_radius() else None
+            self.clip_regions_cache = clip_region.intersect(rect, border_radius) \
+                if clip_region \
+                else ClipRegion.from_rect(rect, border_radius)
+        else:
+            self.clip_regions_cache = clip_region
 
     def wrap_component(self, node: NodeType):
         if callable(node):
@@ -269,46 +277,63 @@ class Node(NodeType):
             if hasattr(properties, prop) and getattr(properties, prop):
                 self.cascaded_properties.add(prop)
 
+    def get_cascade(self) -> Optional[CascadedStyle]:
+        if self.cascade is None and self.cascaded_properties:
+            self.cascade = CascadedStyle(self.properties, self.cascaded_properties)
+        return self.cascade
+
     def inherit_cascaded_properties(self, parent_node: NodeType):
-        if parent_node.cascaded_properties:
-            set_opacity = False
-
-            for prop in parent_node.cascaded_properties:
-                if prop == "opacity" and not self.element_type == ELEMENT_ENUM_TYPE['input_text']:
-                    set_opacity = True
-                if not self.properties.is_user_set(prop):
-                    if prop == "highlight_style":
-                        if self.is_svg:
-                            self.properties.update_property(prop, {
-                                "stroke": parent_node.properties.highlight_style.get("stroke", None) \
-                                    or parent_node.properties.highlight_style.get("color", None),
-                            })
-                        else:
-                            self.properties.update_property(prop, {
-                                "color": parent_node.properties.highlight_style.get("color", None),
-                            })
-                    else:
-                        self.properties.update_property(
-                            prop,
-                            getattr(parent_node.properties, prop),
-                            explicitly_set=False
-                        )
-                    self.cascaded_properties.add(prop)
+        cascade = parent_node.get_cascade()
+        if not cascade:
+            return
+
+        properties = self.properties
+        inherits_only = not self.cascaded_properties
+
+        for prop, value in cascade.values:
+            if not properties.is_user_set(prop):
+                if hasattr(properties, prop):
+                    setattr(properties, prop, value)
+                self.cascaded_properties.add(prop)
+
+        if cascade.highlight_style and not properties.is_user_set("highlight_style"):
+            properties.update_property(
+                "highlight_style",
+                cascade.highlight_style_svg if self.is_svg else cascade.highlight_style
+            )
+            self.cascaded_properties.add("highlight_style")
+
+        if cascade.opacity and not self.element_type == ELEMENT_ENUM_TYPE['input_text']:
+            properties.update_colors_with_opacity()
 
-            if set_opacity:
-                self.properties.update_colors_with_opacity()
+        if inherits_only and cascade.is_unchanged_in(properties):
+            self.cascade = cascade
 
     def is_fully_clipped_by_scroll(self):
         return False
 
-    def v2_measure_intrinsic_size(self, c):
-        self.box_model = BoxModelV2(
-            self.properties, Size2d(0, 0),
+    def v2_acquire_box_model(self, content_size: Size2d = Size2d(0, 0)) -> BoxModelV2:
+        if self.tree:
+            return self.tree.node_pool.acquire_box_model(self, content_size)
+        return BoxModelV2(
+            self.properties,
+            content_size,
             self.clip_nodes,
             relative_positional_node=self.relative_positional_node
         )
+
+    def v2_measure_intrinsic_size(self, c):
+        self.box_model = self.v2_acquire_box_model()
         return self.box_model.intrinsic_margin_size
 
+    def v2_measure_text(self):
+        """
+        Resolves and measures text ahead of an off thread layout, which
+        can't use state or fonts
+        """
+        for child in self.get_children_nodes():
+            child.v2_measure_text()
+
     def v2_grow_size(self):
         pass
 
@@ -352,141 +377,67 @@ class Node(NodeType):
             child.v2_reposition(offset)
 
     def v2_scroll_layout(self, offset: Point2d = None):
-        node_offset = offset
-        if self.properties.is_scrollable() and self.id in self.tree.meta_state.scrollable:
-            new_offset = Point2d(
-                self.tree.meta_state.scrollable[self.id].offset_x,
-                self.tree.meta_state.scrollable[self.id].offset_y
-            )
-            node_offset = new_offset if not node_offset else node_offset + new_offset
+        """
+        Scroll fast path for a scrollable node. Translates descendants by
+        `offset` (defaults to the scroll distance not yet laid out) instead
+        of running a full layout.
+        """
+        scrollable = self.tree.meta_state.scrollable.get(self.id) if self.tree and self.id else None
+        if not scrollable or not self.box_model:
+            return
+
+        offset = offset or scrollable.get_layout_delta()
+        if offset.x or offset.y:
+            self.box_model.shift_content_children(offset)
+            self.box_model.resolve_scroll_bar_rects(scrollable.offset_y)
+            self.box_model.resolve_scroll_bar_x_rects(scrollable.offset_x)
             for child in self.get_children_nodes():
-                child.v2_reposition(node_offset)
-
-        for child in self.get_children_nodes():
-            child.v2_scroll_layout(node_offset)
+                child.v2_reposition(offset)
+        scrollable.commit_layout_offset()
+
+    def get_geometry(self) -> NodeGeometry:
+        box_model = self.box_model
+        border_spacing = box_model.border_spacing
+        border_radius = self.properties.get_border_radius()
+        key = (
+            border_spacing.top, border_spacing.right, border_spacing.bottom, border_spacing.left,
+            border_radius.top_left, border_radius.top_right,
+            border_radius.bottom_right, border_radius.bottom_left
+        )
+        padding_rect = box_model.padding_rect
+        border_rect = box_model.border_rect
+        if not self.geometry or not self.geometry.matches(padding_rect, border_rect, key):
+            self.geometry = NodeGeometry(padding_rect, border_rect, key, border_radius)
+        return self.geometry
 
     def v2_render_borders(self, c: SkiaCanvas, transforms: RenderTransforms = None):
-        self.is_uniform_border = True
-        border_spacing = self.box_model.border_spacing
-        has_border = border_spacing.left or border_spacing.top or border_spacing.right or border_spacing.bottom
-        if has_border:
-            self.is_uniform_border = border_spacing.left == border_spacing.top == border_spacing.right == border_spacing.bottom
-
-            if transforms and transforms.offset:
-                inner_rect = self.box_model.padding_rect.copy()
-                inner_rect = Rect(
-                    inner_rect.x + transforms.offset.x,
-                    inner_rect.y + transforms.offset.y,
-                    inner_rect.width,
-                    inner_rect.height
-                )
-            else:
-                inner_rect = self.box_model.padding_rect
-
-            border_color = self.resolve_render_property("border_color")
-            if self.is_uniform_border:
-                border_width = border_spacing.left
-                c.paint.color = border_color
-                c.paint.style = c.paint.Style.STROKE
-                c.paint.stroke_width = border_width
-
-                bordered_rect = Rect(
-                    inner_rect.x - border_width / 2,
-                    inner_rect.y - border_width / 2,
-                    inner_rect.width + border_width,
-                    inner_rect.height + border_width,
-                )
-
-                border_radius = self.properties.get_border_radius()
-                if border_radius.has_radius():
-                    # Adjust border radius for the stroke offset
-                    if border_radius.is_uniform():
-                        adjusted_radius = border_radius.top_left + border_width / 2
-                        draw_rect(c, bordered_rect, adjusted_radius)
-                    else:
-                        # Scale per-corner radius for border stroke offset
-                        adjusted_radius = BorderRadius((
-                            border_radius.top_left + border_width / 2,
-                            border_radius.top_right + border_width / 2,
-                            border_radius.bottom_right + border_width / 2,
-                            border_radius.bottom_left + border_width / 2
-                        ))
-                        draw_rect(c, bordered_rect, adjusted_radius)
-                else:
-                    c.draw_rect(bordered_rect)
-            else:
-                c.paint.color = border_color
-                c.paint.style = c.paint.Style.STROKE
-                b_rect, p_rect = self.box_model.border_rect, inner_rect
-
-                if transforms and transforms.offset:
-                    b_rect = Rect(
-                        b_rect.x + transforms.offset.x,
-                        b_rect.y + transforms.offset.y,
-                        b_rect.width,
-                        b_rect.height
-                    )
-
-                if border_spacing.left:
-                    c.paint.stroke_width = border_spacing.left
-                    half = border_spacing.left / 2
-                    c.draw_line(b_rect.x + half, p_rect.y, b_rect.x + half, p_rect.y + p_rect.height)
-                if border_spacing.right:
-                    c.paint.stroke_width = border_spacing.right
-                    half = border_spacing.right / 2
-                    c.draw_line(b_rect.x + b_rect.width - half, p_rect.y, b_rect.x + b_rect.width - half, p_rect.y + p_rect.height)
-                if border_spacing.top:
-                    c.paint.stroke_width = border_spacing.top
-                    half = border_spacing.top / 2
-                    c.draw_line(p_rect.x, b_rect.y + half, p_rect.x + p_rect.width, b_rect.y + half)
-                if border_spacing.bottom:
-                    c.paint.stroke_width = border_spacing.bottom
-                    half = border_spacing.bottom / 2
-                    c.draw_line(p_rect.x, b_rect.y + b_rect.height - half, p_rect.x + p_rect.width, b_rect.y + b_rect.height - half)
+        geometry = self.get_geometry()
+        self.is_uniform_border = geometry.is_uniform_border if geometry.has_border else True
+        if geometry.has_border:
+            translated = translate_start(c, transforms.offset if transforms else None)
+            geometry.draw_border(c, self.resolve_render_property("border_color"))
+            if translated:
+                c.restore()
 
     def v2_render_drop_shadow(self, c: SkiaCanvas, transforms: RenderTransforms = None):
         if self.properties.drop_shadow:
-            c.paint.style = c.paint.Style.FILL
-            c.paint.color = self.properties.drop_shadow[4]
-
-            c.paint.imagefilter = ImageFilter.drop_shadow(
-                self.properties.drop_shadow[0],
-                self.properties.drop_shadow[1],
-                self.properties.drop_shadow[2],
-                self.properties.drop_shadow[3],
-                self.properties.drop_shadow[4],
+            translated = translate_start(c, transforms.offset if transforms else None)
+            shadow_cache.draw(
+                c,
+                self.box_model.padding_rect,
+                self.properties.get_border_radius(),
+                tuple(self.properties.drop_shadow)
             )
-
-            inner_rect = self.box_model.padding_rect
-
-            if transforms and transforms.offset:
-                inner_rect = Rect(
-                    inner_rect.x + transforms.offset.x,
-                    inner_rect.y + transforms.offset.y,
-                    inner_rect.width,
-                    inner_rect.height
-                )
-
-            draw_rect(c, inner_rect, self.properties.get_border_radius())
-            c.paint.imagefilter = None
+            if translated:
+                c.restore()
 
     def v2_render_background(self, c: SkiaCanvas, transforms: RenderTransforms = None):
         background_color = self.resolve_render_property("background_color")
         if background_color:
-            c.paint.style = c.paint.Style.FILL
-            c.paint.color = background_color
-
-            inner_rect = self.box_model.padding_rect
-
-            if transforms and transforms.offset:
-                inner_rect = Rect(
-                    inner_rect.x + transforms.offset.x,
-                    inner_rect.y + transforms.offset.y,
-                    inner_rect.width,
-                    inner_rect.height
-                )
-
-            draw_rect(c, inner_rect, self.properties.get_border_radius())
+            translated = translate_start(c, transforms.offset if transforms else None)
+            self.get_geometry().fill.draw(c, paint_registry.get(background_color))
+            if translated:
+                c.restore()
 
     def draw_start(self, c: SkiaCanvas, transforms: RenderTransforms = None):
         self.v2_render_background(c, transforms)
@@ -521,6 +472,10 @@ class Node(NodeType):
         self.children_nodes.clear()
         self.clear_constraint_nodes()
         self.clear_clip_nodes()
+        self.clip_region = None
+        self.clip_regions_cache = None
+        self.cascade = None
+        self.geometry = None
         self.relative_positional_node = None
         self.parent_node = None
         self.tree = None
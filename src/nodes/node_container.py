@@ -1,11 +1,8 @@
 from itertools import cycle
 from typing import List
-from talon.skia import RoundRect
 from talon.skia.canvas import Canvas as SkiaCanvas
 from talon.types import Rect, Point2d
 from .node import Node
-from ..border_radius import draw_manual_rounded_rect_path
-from ..box_model import BoxModelV2
 from ..constants import ELEMENT_ENUM_TYPE, DEFAULT_SCROLL_BAR_TRACK_COLOR, DEFAULT_SCROLL_BAR_THUMB_COLOR
 from ..cursor import Cursor
 from ..interfaces import NodeContainerType, Size2d, NodeType, RenderItem, RenderTransforms
@@ -120,12 +117,7 @@ class NodeContainer(Node, NodeContainerType):
         """
         children_accumulated_size = self.v2_measure_children_intrinsic_size(c)
 
-        self.box_model = BoxModelV2(
-            self.properties,
-            children_accumulated_size,
-            self.clip_nodes,
-            self.relative_positional_node
-        )
+        self.box_model = self.v2_acquire_box_model(children_accumulated_size)
 
         return self.box_model.intrinsic_margin_size_with_bounding_constraints
 
@@ -275,6 +267,7 @@ class NodeContainer(Node, NodeContainerType):
             scrollable.reevaluate(self)
             self.box_model.adjust_scroll_y(scrollable.offset_y)
             self.box_model.adjust_scroll_x(scrollable.offset_x)
+            scrollable.commit_layout_offset()
 
         self.v2_move_cursor_to_align_axis_before_children_render(cursor)
 
@@ -383,36 +376,14 @@ class NodeContainer(Node, NodeContainerType):
             self.box_model.adjust_scroll_x(-self.tree.meta_state.scrollable[self.id].offset_x)
 
     def v2_crop_start(self, c: SkiaCanvas, transforms: RenderTransforms = None):
-        """Apply all clipping regions (ancestors + self) from pre-computed cache."""
-        if not self.clip_regions_cache:
-            return
-
-        for rect, border_radius in self.clip_regions_cache:
-            c.save()
-
-            if transforms and transforms.offset:
-                rect = rect.copy()
-                rect.x += transforms.offset.x
-                rect.y += transforms.offset.y
-
-            if border_radius:
-                self._clip_with_border_radius(c, rect, border_radius)
-            else:
-                c.clip_rect(rect)
+        """Apply the flattened clip region (ancestors + self) from pre-computed cache."""
+        if self.clip_regions_cache:
+            self.clip_regions_cache.apply(c, transforms.offset if transforms else None)
 
     def v2_crop_end(self, c: SkiaCanvas, transforms: RenderTransforms = None):
-        """Restore all clipping regions from cache."""
+        """Restore the clip region applied in v2_crop_start."""
         if self.clip_regions_cache:
-            for _ in range(len(self.clip_regions_cache)):
-                c.restore()
-
-    def _clip_with_border_radius(self, c: SkiaCanvas, rect: Rect, border_radius):
-        """Clip canvas to a rounded rectangle boundary"""
-        if border_radius.is_uniform():
-            c.clip_rrect(RoundRect.from_rect(rect, x=border_radius.top_left, y=border_radius.top_left))
-        else:
-            path = draw_manual_rounded_rect_path(rect, border_radius)
-            c.clip_path(path)
+            c.restore()
 
     def debugger_should_continue(self, c: SkiaCanvas, cursor: Cursor):
         pass
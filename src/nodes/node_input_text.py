@@ -2,7 +2,6 @@ from talon import app
 from talon.skia.canvas import Canvas as SkiaCanvas
 from talon.types import Rect
 from .node import Node
-from ..box_model import BoxModelV2
 from ..constants import ELEMENT_ENUM_TYPE, DEFAULT_INPUT_BACKGROUND_COLOR
 from ..core.entity_manager import entity_manager
 from ..interfaces import RenderTransforms
@@ -31,11 +30,7 @@ class NodeInputText(Node):
         return None
 
     def v2_measure_intrinsic_size(self, c: SkiaCanvas):
-        self.box_model = BoxModelV2(
-            self.properties,
-            clip_nodes=self.clip_nodes,
-            relative_positional_node=self.relative_positional_node
-        )
+        self.box_model = self.v2_acquire_box_model()
         return self.box_model.intrinsic_margin_size
 
     def v2_build_render_list(self):
@@ -1,10 +1,11 @@
+import math
 import re
-from talon.skia import Path
+from typing import Any, Callable
+from talon.skia import Path, Surface
 from talon.skia.canvas import Canvas as SkiaCanvas
 from talon.skia.paint import Paint
 from talon.types import Rect
 from .node import Node
-from ..box_model import BoxModelV2
 from ..cursor import Cursor
 from ..interfaces import NodeSvgType, NodeType, Size2d, RenderTransforms
 from ..properties import NodeSvgProperties
@@ -63,6 +64,25 @@ def scale_d(path, scale_factor):
 
     return ' '.join(result)
 
+SVG_GEOMETRY_CACHE_SIZE = 512
+_svg_geometry_cache: dict[tuple, Any] = {}
+
+def get_svg_geometry(key: tuple, build: Callable[[], Any]) -> Any:
+    """
+    Shared, bounded cache of untranslated, scaled svg geometry keyed by
+    (element kind, geometry props, scale). Identical icons are parsed and
+    built once, then drawn with a canvas translate. Must not be mutated.
+    """
+    geometry = _svg_geometry_cache.get(key)
+    if geometry is None:
+        if len(_svg_geometry_cache) >= SVG_GEOMETRY_CACHE_SIZE:
+            _svg_geometry_cache.pop(next(iter(_svg_geometry_cache)))
+        geometry = _svg_geometry_cache[key] = build()
+    return geometry
+
+def clear_svg_geometry_cache():
+    _svg_geometry_cache.clear()
+
 linecap = {
     "butt": 0,
     "round": 1,
@@ -90,40 +110,42 @@ linejoin_v2 = {
 # Cache for which API version works
 _stroke_api_version = None
 
-def assign_stroke_cap_and_join(c: SkiaCanvas, node: NodeType):
+def set_paint_stroke_cap_and_join(paint: Paint, stroke_linecap: str, stroke_linejoin: str):
     global _stroke_api_version
 
-    c.paint.antialias = True
-
     if _stroke_api_version == 'v2':
         # Use v2 implementation (enum-based)
-        stroke_cap = linecap_v2[node.properties.stroke_linecap if node.properties.stroke_linecap else node.parent_node.stroke_linecap]
-        stroke_join = linejoin_v2[node.properties.stroke_linejoin if node.properties.stroke_linejoin else node.parent_node.stroke_linejoin]
-        StrokeCap = c.paint.stroke_cap.__class__
-        StrokeJoin = c.paint.stroke_join.__class__
-        c.paint.stroke_cap = getattr(StrokeCap, stroke_cap)
-        c.paint.stroke_join = getattr(StrokeJoin, stroke_join)
+        StrokeCap = paint.stroke_cap.__class__
+        StrokeJoin = paint.stroke_join.__class__
+        paint.stroke_cap = getattr(StrokeCap, linecap_v2[stroke_linecap])
+        paint.stroke_join = getattr(StrokeJoin, linejoin_v2[stroke_linejoin])
     elif _stroke_api_version == 'v1':
         # Use v1 implementation (integer-based)
-        c.paint.stroke_cap = linecap[node.properties.stroke_linecap if node.properties.stroke_linecap else node.parent_node.stroke_linecap]
-        c.paint.stroke_join = linejoin[node.properties.stroke_linejoin if node.properties.stroke_linejoin else node.parent_node.stroke_linejoin]
+        paint.stroke_cap = linecap[stroke_linecap]
+        paint.stroke_join = linejoin[stroke_linejoin]
     else:
         # First time - detect which version works
         try:
             # Try v2 implementation (enum-based)
-            stroke_cap = linecap_v2[node.properties.stroke_linecap if node.properties.stroke_linecap else node.parent_node.stroke_linecap]
-            stroke_join = linejoin_v2[node.properties.stroke_linejoin if node.properties.stroke_linejoin else node.parent_node.stroke_linejoin]
-            StrokeCap = c.paint.stroke_cap.__class__
-            StrokeJoin = c.paint.stroke_join.__class__
-            c.paint.stroke_cap = getattr(StrokeCap, stroke_cap)
-            c.paint.stroke_join = getattr(StrokeJoin, stroke_join)
+            StrokeCap = paint.stroke_cap.__class__
+            StrokeJoin = paint.stroke_join.__class__
+            paint.stroke_cap = getattr(StrokeCap, linecap_v2[stroke_linecap])
+            paint.stroke_join = getattr(StrokeJoin, linejoin_v2[stroke_linejoin])
             _stroke_api_version = 'v2'
         except (AttributeError, TypeError):
             # Fall back to v1 implementation (integer-based)
-            c.paint.stroke_cap = linecap[node.properties.stroke_linecap if node.properties.stroke_linecap else node.parent_node.stroke_linecap]
-            c.paint.stroke_join = linejoin[node.properties.stroke_linejoin if node.properties.stroke_linejoin else node.parent_node.stroke_linejoin]
+            paint.stroke_cap = linecap[stroke_linecap]
+            paint.stroke_join = linejoin[stroke_linejoin]
             _stroke_api_version = 'v1'
 
+def assign_stroke_cap_and_join(c: SkiaCanvas, node: NodeType):
+    c.paint.antialias = True
+    set_paint_stroke_cap_and_join(
+        c.paint,
+        node.properties.stroke_linecap if node.properties.stroke_linecap else node.parent_node.stroke_linecap,
+        node.properties.stroke_linejoin if node.properties.stroke_linejoin else node.parent_node.stroke_linejoin,
+    )
+
 class NodeRenderOnly():
     def v2_measure_intrinsic_size(self, c: SkiaCanvas):
         pass
@@ -144,14 +166,117 @@ class NodeSvg(Node, NodeSvgType):
         self.properties.height = self.properties.height or self.properties.size
 
     def v2_measure_intrinsic_size(self, c: SkiaCanvas):
-        self.box_model = BoxModelV2(
-            self.properties,
-            Size2d(self.properties.width, self.properties.height),
-            self.clip_nodes,
-            self.relative_positional_node
-        )
+        self.box_model = self.v2_acquire_box_model(Size2d(self.properties.width, self.properties.height))
         return self.box_model.intrinsic_margin_size
 
+def rasterize_icon(
+    paths: tuple[str, ...],
+    size: float,
+    stroke: str,
+    stroke_width: float,
+    stroke_linecap: str,
+    stroke_linejoin: str,
+    fill: str = None,
+) -> tuple:
+    """
+    Pre-renders 24x24 view box stroke paths at `size`, the same way
+    `NodeSvgPath` draws them. Returns (image, margin), the image is drawn
+    at content position - margin so strokes past the view box aren't cut.
+    """
+    scale = size / 24
+    margin = math.ceil(stroke_width * scale) + 1
+    surface = Surface(math.ceil(size) + margin * 2, math.ceil(size) + margin * 2)
+    canvas = surface.canvas()
+    canvas.translate(margin, margin)
+
+    paint = Paint()
+    paint.antialias = True
+    paint.style = paint.Style.STROKE
+    if stroke:
+        paint.color = stroke
+    paint.stroke_width = stroke_width * scale
+    set_paint_stroke_cap_and_join(paint, stroke_linecap, stroke_linejoin)
+
+    for d in paths:
+        path = get_svg_geometry(("path", d, scale), lambda: Path.from_svg(scale_d(d, scale)))
+        if fill and fill != "none":
+            if stroke:
+                # Same as NodeSvgPath: a wide stroke under the regular one
+                paint.stroke_width = stroke_width * scale * 2
+                paint.color = stroke
+                canvas.draw_path(path, paint)
+                paint.stroke_width = stroke_width * scale
+            else:
+                paint.style = paint.Style.FILL
+            paint.color = fill
+        canvas.draw_path(path, paint)
+
+    return surface.snapshot(), margin
+
+class NodeSvgIcon(Node, NodeSvgType):
+    """
+    A built-in path icon as one layout node, drawn as a single image blit
+    from pre-rendered rasters shared by every icon with the same name,
+    size, colors and stroke settings. Used by `icon()` when
+    `ui_elements_icon_raster` is enabled.
+    """
+    def __init__(self, name: str, paths: list[str], properties: NodeSvgProperties = None):
+        super().__init__(element_type="svg", properties=properties)
+        self.is_svg = True
+        self.name = name
+        self.paths = tuple(paths)
+        self.size = self.properties.size
+
+        self.stroke_linecap = self.properties.stroke_linecap
+        self.stroke_linejoin = self.properties.stroke_linejoin
+
+        self.properties.width = self.properties.width or self.properties.size
+        self.properties.height = self.properties.height or self.properties.size
+
+    def v2_measure_intrinsic_size(self, c: SkiaCanvas):
+        self.box_model = self.v2_acquire_box_model(Size2d(self.properties.width, self.properties.height))
+        return self.box_model.intrinsic_margin_size
+
+    def v2_build_render_list(self):
+        if not self.uses_decoration_render:
+            self.tree.append_to_render_list(
+                node=self,
+                draw=self.v2_render
+            )
+
+    def v2_render_decorator(self, c, transforms: RenderTransforms = None):
+        return self.v2_render(c, transforms)
+
+    def v2_render(self, c: SkiaCanvas, transforms: RenderTransforms = None):
+        self.v2_render_background(c, transforms)
+        self.v2_render_borders(c, transforms)
+
+        top_left_pos = self.box_model.content_children_pos
+        x, y = top_left_pos.x, top_left_pos.y
+        if transforms and transforms.offset:
+            x += transforms.offset.x
+            y += transforms.offset.y
+
+        stroke = self.resolve_render_property("stroke")
+        fill = self.resolve_render_property("fill") if self.properties.is_user_set("fill") else None
+        if fill and not self.properties.is_user_set("stroke"):
+            stroke = None
+
+        key = (
+            "icon", self.paths, self.size, stroke, fill, self.properties.stroke_width,
+            self.stroke_linecap, self.stroke_linejoin
+        )
+        image, margin = get_svg_geometry(key, lambda: rasterize_icon(
+            self.paths,
+            self.size,
+            stroke,
+            self.properties.stroke_width,
+            self.stroke_linecap,
+            self.stroke_linejoin,
+            fill,
+        ))
+        c.draw_image(image, x - margin, y - margin)
+
 class NodeSvgPath(Node, NodeType, NodeRenderOnly):
     def __init__(self, properties: NodeSvgProperties = None):
         super().__init__(element_type="svg_path", properties=properties)
@@ -176,12 +301,15 @@ class NodeSvgPath(Node, NodeType, NodeRenderOnly):
             top_left_pos.x += transforms.offset.x
             top_left_pos.y += transforms.offset.y
 
-        new_d = scale_d(self.properties.d, scale)
-        path = Path.from_svg(new_d)
-        translated_path = Path()
-        translated_path.add_path_offset(path, dx=top_left_pos.x, dy=top_left_pos.y, add_mode=Path.AddMode.APPEND)
+        d = self.properties.d
+        path = get_svg_geometry(
+            ("path", d, scale),
+            lambda: Path.from_svg(scale_d(d, scale))
+        )
 
         prev_paint = c.paint.clone()
+        c.save()
+        c.translate(top_left_pos.x, top_left_pos.y)
 
         c.paint.style = c.paint.Style.STROKE
         stroke = self.resolve_render_property("stroke") or self.parent_node.resolve_render_property("stroke")
@@ -203,14 +331,15 @@ class NodeSvgPath(Node, NodeType, NodeRenderOnly):
                 fill_stroke_width = c.paint.stroke_width
                 c.paint.stroke_width = c.paint.stroke_width * 2
                 c.paint.style = c.paint.Style.STROKE
-                c.draw_path(translated_path, c.paint)
+                c.draw_path(path, c.paint)
                 c.paint.stroke_width = fill_stroke_width
             else:
                 c.paint.style = c.paint.Style.FILL
             c.paint.color = fill
 
-        c.draw_path(translated_path, c.paint)
+        c.draw_path(path, c.paint)
 
+        c.restore()
         c.paint = prev_paint
 
 class NodeSvgRect(Node, NodeType, NodeRenderOnly):
@@ -324,7 +453,6 @@ class NodeSvgPolyline(Node, NodeType, NodeRenderOnly):
     def v2_render(self, c: SkiaCanvas, transforms: RenderTransforms = None):
         scale = self.parent_node.size / 24
 
-        raw_points = self.properties.points.split(" ")
         top_left_pos = self.parent_node.box_model.content_children_pos
 
         if transforms and transforms.offset:
@@ -332,17 +460,15 @@ class NodeSvgPolyline(Node, NodeType, NodeRenderOnly):
             top_left_pos.x += transforms.offset.x
             top_left_pos.y += transforms.offset.y
 
-        points = [
-            (
-                float(raw_points[i]) * scale + top_left_pos.x,
-                float(raw_points[i + 1]) * scale + top_left_pos.y
-            )
-            for i in range(0, len(raw_points), 2)
-        ]
+        raw_points = self.properties.points
+        points = get_svg_geometry(
+            ("points", raw_points, scale),
+            lambda: self.scale_points(raw_points, scale)
+        )
 
         prev_paint = c.paint.clone()
-
-        top_left_pos = self.parent_node.box_model.content_children_pos
+        c.save()
+        c.translate(top_left_pos.x, top_left_pos.y)
 
         if self.properties.fill and self.properties.fill != "none":
             c.paint.style = c.paint.Style.FILL
@@ -355,8 +481,17 @@ class NodeSvgPolyline(Node, NodeType, NodeRenderOnly):
         c.paint.stroke_width = (self.properties.stroke_width or self.parent_node.properties.stroke_width) * scale
         c.draw_points(mode=c.PointMode.POLYGON, points=points)
 
+        c.restore()
         c.paint = prev_paint
 
+    @staticmethod
+    def scale_points(raw_points: str, scale: float) -> list[tuple[float, float]]:
+        raw_points = raw_points.split(" ")
+        return [
+            (float(raw_points[i]) * scale, float(raw_points[i + 1]) * scale)
+            for i in range(0, len(raw_points), 2)
+        ]
+
 class NodeSvgLine(Node, NodeType, NodeRenderOnly):
     def __init__(self, properties: NodeSvgProperties = None):
         super().__init__(element_type="svg_line", properties=properties)
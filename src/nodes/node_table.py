@@ -3,7 +3,6 @@ from talon import actions
 from talon.skia.canvas import Canvas as SkiaCanvas
 from typing import Optional
 from .node_container import NodeContainer
-from ..box_model import BoxModelV2
 from ..interfaces import Size2d
 from ..properties import Properties
 
@@ -155,12 +154,7 @@ class NodeTableHeader(NodeContainer):
         width = table_node.col_widths[self.column_index] if table_node else 0
         height = table_node.row_heights[self.row_index] if table_node else 0
 
-        self.box_model = BoxModelV2(
-            self.properties,
-            Size2d(width, height),
-            self.clip_nodes,
-            self.relative_positional_node
-        )
+        self.box_model = self.v2_acquire_box_model(Size2d(width, height))
 
         return self.box_model.intrinsic_margin_size_with_bounding_constraints
 
@@ -181,12 +175,7 @@ class NodeTableData(NodeContainer):
         width = table_node.col_widths[self.column_index] if table_node else 0
         height = table_node.row_heights[self.row_index] if table_node else 0
 
-        self.box_model = BoxModelV2(
-            self.properties,
-            Size2d(width, height),
-            self.clip_nodes,
-            self.relative_positional_node
-        )
+        self.box_model = self.v2_acquire_box_model(Size2d(width, height))
 
         return self.box_model.intrinsic_margin_size_with_bounding_constraints
 
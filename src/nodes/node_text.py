@@ -3,12 +3,11 @@ from talon.skia.canvas import Canvas as SkiaCanvas
 from talon.skia.paint import Paint
 from typing import Literal
 from .node import Node
-from ..box_model import BoxModelV2
 from ..core.state_manager import state_manager
 from ..interfaces import Size2d, RenderTransforms
 from ..properties import NodeTextProperties
 from ..fonts import get_typeface
-from ..utils import draw_text_simple
+from ..utils import draw_text_simple, is_layout_thread
 
 def split_lines(text, max_width, measure_text):
     lines = []
@@ -98,6 +97,7 @@ class NodeText(Node):
         self.text_width = 0
         self.text_line_height = 0
         self.text_body_height = 0
+        self.text_measure_key = None
 
         if element_type == "button" or element_type == "link":
             self.on_click = self.properties.on_click or (lambda: None)
@@ -132,27 +132,39 @@ class NodeText(Node):
         Basically naturally how much width/height based on content or
         user defined width/height it takes up.
         """
+        if not is_layout_thread():
+            self.v2_measure_text()
+        self.box_model = self.v2_acquire_box_model(Size2d(self.text_width, self.text_body_height))
+        return self.box_model.intrinsic_margin_size
+
+    def v2_measure_text(self):
         # TODO: remove mutation from measure phase
         if self.element_type == "text" and self.own_id:
             self.text = str(state_manager.use_text_mutation(self))
 
-        paint = Paint()
-        paint.textsize = self.properties.font_size
-        if self.properties.font_family:
-            typeface = get_typeface(self.properties.font_family)
-            if typeface:
-                paint.typeface = typeface
-
-        paint.font.embolden = True if self.properties.font_weight == "bold" else False
-
-        self.v2_measure_and_account_for_multiline(paint)
-        self.box_model = BoxModelV2(
-            self.properties,
-            Size2d(self.text_width, self.text_body_height),
-            self.clip_nodes,
-            self.relative_positional_node
+        # Text metrics don't depend on the available size, so repeated
+        # layouts (e.g. while resizing) can reuse the last measurement.
+        measure_key = (
+            self.text,
+            self.properties.font_size,
+            self.properties.font_family,
+            self.properties.font_weight,
+            self.properties.width,
+            self.properties.max_width,
+            self.properties.gap,
         )
-        return self.box_model.intrinsic_margin_size
+        if measure_key != self.text_measure_key:
+            paint = Paint()
+            paint.textsize = self.properties.font_size
+            if self.properties.font_family:
+                typeface = get_typeface(self.properties.font_family)
+                if typeface:
+                    paint.typeface = typeface
+
+            paint.font.embolden = True if self.properties.font_weight == "bold" else False
+
+            self.v2_measure_and_account_for_multiline(paint)
+            self.text_measure_key = measure_key
 
     def v2_build_render_list(self):
         if not self.uses_decoration_render:
@@ -198,12 +210,10 @@ class NodeText(Node):
 
         # This should be in layout phase
 
+        text_top_left = self.box_model.content_children_pos.copy()
         if transforms and transforms.offset:
-            text_top_left = self.box_model.content_children_pos.copy()
             text_top_left.x += transforms.offset.x
             text_top_left.y += transforms.offset.y
-        else:
-            text_top_left = self.box_model.content_children_pos
 
         available_width = self.box_model.content_size.width - self.box_model.content_children_size.width
         if self.properties.text_align == "center":
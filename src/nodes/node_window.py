@@ -3,21 +3,17 @@ from .node_container import NodeContainer
 from ..constants import ELEMENT_ENUM_TYPE
 from ..events import WindowCloseEvent
 from ..properties import Properties, NodeWindowProperties
-from ..utils import generate_hash, adjust_color_brightness
+from ..utils import generate_hash, adjust_color_brightness, get_param_count
 from ..core.entity_manager import entity_manager
-import inspect
-
-last_pos_map = {}
+from ..core.layout_store import layout_store
 
 class NodeWindow(NodeContainer):
     def __init__(self, window_properties: dict, body_properties: dict = None):
-        global last_pos_map
         div, icon, button, text, state = actions.user.ui_elements(["div", "icon", "button", "text", "state"])
         self.hash = generate_hash({
             **window_properties,
             **body_properties,
         })
-        self.init_position()
         self.destroying = False
         last_pos = self.last_pos
         last_docked_pos = self.last_docked_pos
@@ -107,8 +103,8 @@ class NodeWindow(NodeContainer):
             })
 
         if resolved_window_props.get("resizable", False) and not self.is_minimized:
-            saved_w = last_pos_map[self.hash].get("last_resize_width")
-            saved_h = last_pos_map[self.hash].get("last_resize_height")
+            saved_w = self.saved_geometry.get("last_resize_width")
+            saved_h = self.saved_geometry.get("last_resize_height")
             if saved_w is not None:
                 resolved_window_props["width"] = saved_w
             if saved_h is not None:
@@ -120,7 +116,6 @@ class NodeWindow(NodeContainer):
         )
 
         def on_minimize():
-            global last_pos_map
             new_is_minimized = not self.is_minimized
             self.update_saved_positions()
             set_is_minimized(new_is_minimized)
@@ -138,7 +133,7 @@ class NodeWindow(NodeContainer):
                 def deferred_close():
                     if not self.destroying:
                         if window_properties.get("on_close", None):
-                            if len(inspect.signature(window_properties.get("on_close")).parameters) == 1:
+                            if get_param_count(window_properties.get("on_close")) == 1:
                                 window_properties.get("on_close")(e)
                             else:
                                 window_properties.get("on_close")()
@@ -203,28 +198,24 @@ class NodeWindow(NodeContainer):
         else:
             self.add_child(self.body)
 
-    def init_position(self):
-        if not last_pos_map.get(self.hash):
-            last_pos_map[self.hash] = {
-                "last_pos": None,
-                "last_docked_pos": None,
-                "last_pos_drag_offset": None,
-                "last_docked_pos_drag_offset": None,
-                "last_resize_width": None,
-                "last_resize_height": None,
-            }
+    @property
+    def saved_geometry(self):
+        return layout_store.get_window(self.hash)
 
     @property
     def last_pos(self):
-        return last_pos_map.get(self.hash, {}).get("last_pos", None)
+        return self.saved_geometry.get("last_pos", None)
 
     @property
     def last_docked_pos(self):
-        return last_pos_map.get(self.hash, {}).get("last_docked_pos", None)
+        return self.saved_geometry.get("last_docked_pos", None)
 
     def save_resize_dimensions(self, width, height):
-        last_pos_map[self.hash]["last_resize_width"] = width
-        last_pos_map[self.hash]["last_resize_height"] = height
+        layout_store.update_window(
+            self.hash,
+            last_resize_width=width,
+            last_resize_height=height,
+        )
 
     def update_saved_positions(self):
         if self.has_dock_behavior and self.is_minimized:
@@ -240,10 +231,10 @@ class NodeWindow(NodeContainer):
         # Our tree meta state only keeps track of one drag offset
         # But window has two - minimized vs non-minimized
         # so we update the tree meta state to reflect our internal state
-        if self.has_dock_behavior and last_pos_map[self.hash].get("last_docked_pos_drag_offset", None):
+        if self.has_dock_behavior and self.saved_geometry.get("last_docked_pos_drag_offset", None):
             try:
                 self.tree.meta_state._draggable_offset[self.id] = \
-                    last_pos_map[self.hash].get("last_docked_pos_drag_offset", None)
+                    self.saved_geometry.get("last_docked_pos_drag_offset", None)
             except Exception as e:
                 print(f"Error setting draggable offset: {e}")
 
@@ -251,28 +242,28 @@ class NodeWindow(NodeContainer):
         # Our tree meta state only keeps track of one drag offset
         # But window has two - minimized vs non-minimized
         # so we update the tree meta state to reflect our internal state
-        if self.has_dock_behavior and last_pos_map[self.hash].get("last_pos_drag_offset", None):
+        if self.has_dock_behavior and self.saved_geometry.get("last_pos_drag_offset", None):
             try:
                 self.tree.meta_state._draggable_offset[self.id] = \
-                    last_pos_map[self.hash].get("last_pos_drag_offset", None)
+                    self.saved_geometry.get("last_pos_drag_offset", None)
             except Exception as e:
                 print(f"Error setting draggable offset: {e}")
 
     def set_last_pos(self, pos):
         try:
             offset = self.tree.meta_state.get_accumulated_drag_offset(self.id)
-            last_pos_map[self.hash]["last_pos_drag_offset"] = offset
+            layout_store.update_window(self.hash, last_pos_drag_offset=offset)
         except Exception as e:
             print(f"Error setting last pos drag offset: {e}")
-        last_pos_map[self.hash]["last_pos"] = pos
+        layout_store.update_window(self.hash, last_pos=pos)
 
     def set_last_docked_pos(self, pos):
         try:
             offset = self.tree.meta_state.get_accumulated_drag_offset(self.id)
-            last_pos_map[self.hash]["last_docked_pos_drag_offset"] = offset
+            layout_store.update_window(self.hash, last_docked_pos_drag_offset=offset)
         except Exception as e:
             print(f"Error setting last docked pos drag offset: {e}")
-        last_pos_map[self.hash]["last_docked_pos"] = pos
+        layout_store.update_window(self.hash, last_docked_pos=pos)
 
     def __getitem__(self, children_nodes=None):
         if self.is_minimized:
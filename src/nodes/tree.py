@@ -1,12 +1,11 @@
-import inspect
 import time
 import uuid
 import threading
 import traceback
 import weakref
-from talon import cron, settings, ctrl, storage
+from talon import cron, settings, ctrl
 from talon.canvas import Canvas as RealCanvas, MouseEvent
-from talon.skia import RoundRect
+from talon.skia import Surface as RealSurface
 from talon.skia.canvas import Canvas as SkiaCanvas
 from talon.types import Rect, Point2d
 from typing import Any, Callable
@@ -17,18 +16,28 @@ from ..constants import (
     ELEMENT_ENUM_TYPE,
     DRAG_INIT_THRESHOLD,
     DEFAULT_CURSOR_REFRESH_RATE,
+    HOVER_VALIDATION_QUIET_TIME,
+    CURSOR_IDLE_TICKS,
+    CURSOR_IDLE_POLL_INTERVAL,
     RESIZE_EDGE_THRESHOLD,
     RESIZE_GHOST_COLOR,
     RESIZE_GHOST_STROKE_WIDTH,
     RESIZE_EDGE_HIGHLIGHT_COLOR,
     RESIZE_EDGE_HIGHLIGHT_WIDTH,
 )
-from ..utils import draw_rect, get_scale, scale_value
+from ..utils import draw_rect, get_param_count, get_scale, scale_value, set_layout_thread_scale
 from ..canvas_wrapper import CanvasWeakRef
-from ..border_radius import draw_manual_rounded_rect_path
+from ..clip_region import ClipRegion
+from ..damage import DamageRegion, get_paint_bounds
+from ..display_list import DisplayList, record_display_list
 from ..core.entity_manager import entity_manager
+from ..core.layout_store import layout_store
+from ..core.layout_worker import LayoutWorker
 from ..core.animations import TransitionManager, ANIMATABLE_COLOR_PROPERTIES
+from ..core.node_pool import NodePool
 from ..core.render_manager import RenderManager, RenderCause
+from ..core.scheduler import Scheduler
+from ..core.scroll_input import ScrollInput
 from ..core.state_manager import state_manager
 from ..core.store import store
 from ..cursor import Cursor, CursorV2
@@ -58,11 +67,16 @@ from ..utils import (
     subtract_rect,
 )
 
-scroll_throttle_job = None
-scroll_throttle_time = "30ms"
-
 debug = True
 
+# Decorator repaints for these only change high frequency content, so
+# canvas bookkeeping (blockable canvases, key controls) can be skipped
+DECORATOR_PAINT_ONLY_CAUSES = frozenset((
+    RenderCause.MOUSE_HIGHLIGHT,
+    RenderCause.TEXT_MUTATION,
+    RenderCause.RESIZE_GHOST,
+))
+
 def log_trace():
     if debug:
         traceback.print_exc()
@@ -71,12 +85,6 @@ def log(*args):
     if debug:
         print("LOG:", *args)
 
-def scroll_throttle_clear():
-    global scroll_throttle_job
-    if scroll_throttle_job:
-        cron.cancel(scroll_throttle_job)
-    scroll_throttle_job = None
-
 class ScrollRegion(ScrollRegionType):
     def __init__(self, scroll_y: int = 0, scroll_x: int = 0):
         self.scroll_y = scroll_y
@@ -91,6 +99,16 @@ class Scrollable(ScrollableType):
         self.max_height = 0
         self.view_width = 0
         self.max_width = 0
+        self.layout_offset_x = 0
+        self.layout_offset_y = 0
+
+    def get_layout_delta(self) -> Point2d:
+        """Scroll distance not yet applied to the laid out box models"""
+        return Point2d(self.offset_x - self.layout_offset_x, self.offset_y - self.layout_offset_y)
+
+    def commit_layout_offset(self):
+        self.layout_offset_x = self.offset_x
+        self.layout_offset_y = self.offset_y
 
     def reevaluate(self, node: NodeType):
         max_height = node.box_model.content_children_with_padding_size.height
@@ -152,6 +170,7 @@ class MetaState(MetaStateType):
         self.resize_edge = None
         self.resize_start_pos = None
         self.resize_start_rect = None
+        self.resize_start_drag_offset = None
         self.resize_ghost_rect = None
 
     @property
@@ -394,6 +413,7 @@ class MetaState(MetaStateType):
         self.resize_edge = edge
         self.resize_start_pos = mouse_pos
         self.resize_start_rect = start_rect
+        self.resize_start_drag_offset = self._draggable_offset.get(node_id)
         self.resize_ghost_rect = Rect(start_rect.x, start_rect.y, start_rect.width, start_rect.height)
 
     def clear_resize_drag(self):
@@ -401,6 +421,7 @@ class MetaState(MetaStateType):
         self.resize_edge = None
         self.resize_start_pos = None
         self.resize_start_rect = None
+        self.resize_start_drag_offset = None
         self.resize_ghost_rect = None
 
     def is_resize_dragging(self, node_id=None):
@@ -509,6 +530,7 @@ class RenderCauseState(RenderCauseStateType):
 
 class Tree(TreeType):
     Canvas = RealCanvas # override for testing
+    Surface = RealSurface # override for testing
     def __init__(
             self,
             tree_constructor: callable,
@@ -524,12 +546,14 @@ class Tree(TreeType):
         self.current_base_canvas = None
         self.cursor = None
         self.cursor_v2 = None
-        self.cursor_refresh_job = None
         self.cursor_refresh_rate = DEFAULT_CURSOR_REFRESH_RATE
+        self.cursor_idle_ticks = 0
         self.cursor_position = self.get_cursor_position()
-        self.hover_validation_job = None
         self.last_mouse_event_time = 0
-        self.effects = []
+        # Keyed by id(effect) in registration order, with indexes for dispatch
+        self.effects: dict[int, Effect] = {}
+        self.effects_by_dependency: dict[str, dict[int, Effect]] = defaultdict(dict)
+        self.effects_by_component: dict[tuple, dict[int, Effect]] = defaultdict(dict)
         self.destroying = False
         self.unmounting = False
         self._unmount_complete = False
@@ -548,6 +572,7 @@ class Tree(TreeType):
         self.is_mounted = False
         self.last_blockable_rects = []
         self.last_base_snapshot = None
+        self.last_base_snapshot_rect: Rect = None
         self.last_hints_snapshot = None
         self.lock = threading.Lock()
         self.meta_state = MetaState()
@@ -557,23 +582,37 @@ class Tree(TreeType):
         self.render_cause = RenderCauseState()
         self.render_list = []
         self.render_layers = []
+        self.display_list: DisplayList = None
+        self.damage_frame = None
+        self.damage_frame_rect: Rect = None
+        self.decorator_static_layer: DisplayList = None
+        self.decorator_static_key: tuple = None
         self._tree_constructor = tree_constructor
         self.render_version = 2
         self.render_debounce_job = None
         self.redistribute_box_model = False
         self.root_node = None
         self.scroll_amount_per_tick = settings.get("user.ui_elements_scroll_speed")
+        self.resize_layout_interval = settings.get("user.ui_elements_resize_layout_interval", 0)
+        self.threaded_layout = settings.get("user.ui_elements_threaded_layout", False)
+        self.layout_worker = LayoutWorker()
+        self.layout_ready = False
+        self.pending_mouse_events: list[MouseEvent] = []
+        self.last_resize_layout_time = 0
         self.show_hints = False
         self.style: Style = None
+        self.scheduler = Scheduler()
         self.transition_manager = TransitionManager(self)
+        self.scroll_input = ScrollInput(self)
+        self.node_pool = NodePool()
 
-        # Load scale from storage per tree, fallback to settings
-        saved_scales = storage.get("ui_elements", {}).get("scale_per_tree", {})
+        # Load saved scale per tree, fallback to settings
         default_scale = settings.get("user.ui_elements_scale", 1.0)
-        self.scale = saved_scales.get(hashed_tree_constructor, default_scale)
+        self.scale = layout_store.get_scale(hashed_tree_constructor, default_scale)
 
         if not store.trees:
             store.scale = settings.get("user.ui_elements_scale", 1.0)
+        store.track_ref_counts = settings.get("user.ui_elements_debug_ref_counts", False)
         state_manager.init_states(initial_state)
         self.init_tree_constructor()
         state_manager.increment_ref_count_trees()
@@ -608,23 +647,39 @@ class Tree(TreeType):
             return Point2d(0, 0)
 
     def start_cursor_refresh_cycle(self, refresh_rate: int = DEFAULT_CURSOR_REFRESH_RATE):
-        if self.cursor_refresh_job is None:
+        if not self.scheduler.is_scheduled("cursor_refresh"):
             self.cursor_refresh_rate = refresh_rate
+            self.cursor_idle_ticks = 0
+            self.scheduler.interval("cursor_refresh", f"{refresh_rate}ms", self.on_cursor_refresh)
 
-            def cursor_refresh_callback():
-                if not self.destroying and self.has_cursor_node:
-                    self.update_cursor_positions()
-                    self.render_manager.render_cursor_update()
+    def on_cursor_refresh(self):
+        if self.destroying or not self.has_cursor_node:
+            return
 
-            self.cursor_refresh_job = cron.interval(f"{refresh_rate}ms", cursor_refresh_callback)
+        if self.update_cursor_positions():
+            if self.cursor_idle_ticks >= CURSOR_IDLE_TICKS:
+                # Pointer moved again, back to the full refresh rate
+                self.stop_cursor_refresh_cycle()
+                self.start_cursor_refresh_cycle(self.cursor_refresh_rate)
+            self.cursor_idle_ticks = 0
+            self.render_manager.render_cursor_update()
+        else:
+            self.cursor_idle_ticks += 1
+            if self.cursor_idle_ticks == CURSOR_IDLE_TICKS:
+                # Pointer is idle, only poll slowly until it moves
+                self.scheduler.interval("cursor_refresh", CURSOR_IDLE_POLL_INTERVAL, self.on_cursor_refresh)
 
     def stop_cursor_refresh_cycle(self):
-        if self.cursor_refresh_job:
-            cron.cancel(self.cursor_refresh_job)
-            self.cursor_refresh_job = None
+        self.scheduler.cancel("cursor_refresh")
 
-    def update_cursor_positions(self):
-        self.cursor_position = self.get_cursor_position()
+    def update_cursor_positions(self) -> bool:
+        """Returns True if the pointer moved since the last update"""
+        position = self.get_cursor_position()
+        moved = not self.cursor_position \
+            or position.x != self.cursor_position.x \
+            or position.y != self.cursor_position.y
+        self.cursor_position = position
+        return moved
 
     def setup_cursor_refresh_cycle(self):
         if self.has_cursor_node:
@@ -638,23 +693,25 @@ class Tree(TreeType):
                 self.schedule_hover_validation()
                 return
             time_since_last_event = time.time() - self.last_mouse_event_time
-            if time_since_last_event >= 0.2:
+            if time_since_last_event >= HOVER_VALIDATION_QUIET_TIME:
                 if self.validate_hover_state():
                     self.render_manager.render_mouse_highlight()
-                self.hover_validation_job = None
             else:
-                self.schedule_hover_validation()
+                # Wake up once when the mouse has been quiet long enough,
+                # instead of polling while it keeps moving
+                remaining_ms = int((HOVER_VALIDATION_QUIET_TIME - time_since_last_event) * 1000)
+                self.schedule_hover_validation(max(remaining_ms, 16))
 
-    def schedule_hover_validation(self):
-        if self.hover_validation_job:
-            cron.cancel(self.hover_validation_job)
+    def schedule_hover_validation(self, delay_ms: int = 100):
+        self.scheduler.after("hover_validation", f"{delay_ms}ms", self.check_for_stale_hover)
 
-        self.hover_validation_job = cron.after("100ms", self.check_for_stale_hover)
+    def is_hover_validation_scheduled(self) -> bool:
+        return self.scheduler.is_scheduled("hover_validation")
 
     def init_tree_constructor(self):
         state_manager.set_processing_tree(self)
         try:
-            if len(inspect.signature(self._tree_constructor).parameters) > 0:
+            if get_param_count(self._tree_constructor) > 0:
                 if self.props and not isinstance(self.props, dict):
                     raise Exception("props passed to actions.user.ui_elements_show should be a dictionary, and the receiving function should accept a single argument `props`")
                 self.root_node = self._tree_constructor(self.props or {})
@@ -676,13 +733,41 @@ class Tree(TreeType):
         for child in node.get_children_nodes():
             self.test(child)
 
-    def compute_clip_regions_cache(self):
+    def compute_clip_regions_cache(self, node: NodeType = None):
+        # Nodes under the same overflow boundaries share one flattened region
+        regions_by_chain = {}
+
         def compute_for_node(node: NodeType):
-            node.compute_clip_regions_cache()
+            chain = tuple(id(ref()) for ref in node.clip_nodes)
+            if chain not in regions_by_chain:
+                regions_by_chain[chain] = ClipRegion.from_clip_nodes(node.clip_nodes) \
+                    if chain \
+                    else None
+            node.compute_clip_regions_cache(regions_by_chain[chain])
             for child in node.get_children_nodes():
                 compute_for_node(child)
 
-        compute_for_node(self.root_node)
+        compute_for_node(node or self.root_node)
+
+    def scroll_layout(self):
+        """
+        Scroll fast path. Instead of a full layout, translate only the
+        descendants of scrollable containers whose offset changed.
+        Returns the scrolled nodes, or None if a full layout is required.
+        """
+        scrolled_nodes = []
+        for id, scrollable in list(self.meta_state.scrollable.items()):
+            delta = scrollable.get_layout_delta()
+            if delta.x or delta.y:
+                node = self.meta_state.id_to_node.get(id)
+                if not node or not node.box_model:
+                    return None
+                scrolled_nodes.append((node, delta))
+
+        for node, delta in scrolled_nodes:
+            node.v2_scroll_layout(delta)
+
+        return [node for node, _ in scrolled_nodes]
 
     def nonlayout_flow(self):
         for node in self.absolute_nodes + self.fixed_nodes:
@@ -701,6 +786,7 @@ class Tree(TreeType):
     def build_base_render_layers(self):
         self.render_list.clear()
         self.render_layers.clear()
+        self.invalidate_display_list()
         self.root_node.v2_build_render_list()
 
         # Group by (z_index, z_subindex)
@@ -717,45 +803,122 @@ class Tree(TreeType):
         ]
         self.render_layers.sort(key=lambda l: (l.z_index, l.z_subindex))
 
+    def get_display_list(self) -> DisplayList:
+        """
+        Render layers recorded as a flat display list. Recorded on first
+        use after the render layers are built or node positions change,
+        then replayed for every draw until then.
+        """
+        if self.display_list is None:
+            self.display_list = record_display_list([
+                item
+                for layer in self.render_layers
+                for item in layer.items
+            ])
+        return self.display_list
+
+    def invalidate_display_list(self):
+        self.display_list = None
+        self.damage_frame = None
+        self.damage_frame_rect = None
+
+    def get_render_bounds(self) -> Rect:
+        """Whole pixel bounding rect of everything in the render list, including shadows"""
+        bounds = DamageRegion()
+        for item in self.render_list:
+            bounds.add(get_paint_bounds(item.node))
+        return bounds.rect
+
+    def snapshot_base_canvas(self):
+        """
+        Rasterize the current render layers once so dragging and cursor
+        following can blit a single image instead of replaying every layer
+        per mouse move.
+        """
+        self.last_base_snapshot = None
+        self.last_base_snapshot_rect = self.get_render_bounds()
+        rect = self.last_base_snapshot_rect
+        if rect and rect.width > 0 and rect.height > 0:
+            surface = self.Surface(rect.width, rect.height)
+            surface_canvas = surface.canvas()
+            surface_canvas.translate(-rect.x, -rect.y)
+            self.get_display_list().replay(surface_canvas)
+            self.last_base_snapshot = surface.snapshot()
+
+    def clear_base_snapshot(self):
+        self.last_base_snapshot = None
+        self.last_base_snapshot_rect = None
+
     def move_canvas(self, canvas: SkiaCanvas):
         offset = self.meta_state.get_current_drag_offset(self.draggable_node.id)
-        transforms = RenderTransforms(offset=offset)
-        for layer in self.render_layers:
-            layer.draw_to_canvas(canvas, transforms)
+        if self.last_base_snapshot:
+            rect = self.last_base_snapshot_rect
+            canvas.draw_image(self.last_base_snapshot, rect.x + offset.x, rect.y + offset.y)
+            return
+        self.get_display_list().replay(canvas, offset)
 
     def commit_base_canvas(self):
-        cursor_transforms = RenderTransforms(offset=self.cursor_position) \
-            if self.has_cursor_node \
-            else None
+        offset = self.cursor_position if self.has_cursor_node else None
+        self.get_display_list().replay(self.current_base_canvas, offset)
+        self.damage_frame = None
+        self.damage_frame_rect = None
 
-        for layer in self.render_layers:
-            layer.draw_to_canvas(self.current_base_canvas, cursor_transforms)
+    def commit_base_canvas_damaged(self, changed_node_ids: set[str]) -> bool:
+        """
+        Repaints only what the changed nodes cover. The last frame is kept
+        as an image: the damaged area is cleared and redrawn from the render
+        items intersecting it, then the image is drawn as a single blit.
+        Returns False if a full commit is needed instead.
+
+        Base canvas only. Decorator content (highlight overlays, text
+        mutations) is small and redrawn in full per decorator draw, with the
+        focus outline and hints replayed from a cached layer.
+        """
+        if self.display_list is None or self.has_cursor_node:
+            return False
+
+        damage = DamageRegion()
+        for node_id in changed_node_ids:
+            node = self.meta_state.id_to_node.get(node_id)
+            if node:
+                damage.add_subtree(node)
+        if damage.is_empty():
+            return False
+
+        display_list = self.display_list
+        damaged_items = {
+            index
+            for index, item in enumerate(display_list.items)
+            if damage.intersects(get_paint_bounds(item.node))
+        }
+        display_list.rerecord(damaged_items)
+
+        if self.damage_frame is None:
+            rect = self.get_render_bounds()
+            if not rect or rect.width <= 0 or rect.height <= 0:
+                return False
+            self.damage_frame = self.Surface(rect.width, rect.height)
+            self.damage_frame_rect = rect
+            frame_canvas = self.damage_frame.canvas()
+            frame_canvas.translate(-rect.x, -rect.y)
+            display_list.replay(frame_canvas)
+        else:
+            rect = self.damage_frame_rect
+            frame_canvas = self.damage_frame.canvas()
+            frame_canvas.save()
+            frame_canvas.translate(-rect.x, -rect.y)
+            frame_canvas.clip_rect(damage.rect)
+            frame_canvas.clear("00000000")
+            display_list.replay_items(frame_canvas, damaged_items)
+            frame_canvas.restore()
+
+        self.current_base_canvas.draw_image(self.damage_frame.snapshot(), rect.x, rect.y)
+        return True
 
     def apply_clip_regions(self, canvas: SkiaCanvas, node: NodeType, transforms: RenderTransforms = None):
-        clip_count = 0
-        if node.clip_nodes:
-            for clip_ref in node.clip_nodes:
-                clip_node = clip_ref()
-                if clip_node and clip_node.box_model:
-                    canvas.save()
-                    clip_count += 1
-
-                    rect = clip_node.box_model.padding_rect
-                    if transforms and transforms.offset:
-                        rect = rect.copy()
-                        rect.x += transforms.offset.x
-                        rect.y += transforms.offset.y
-
-                    if clip_node.properties.has_border_radius():
-                        border_radius = clip_node.properties.get_border_radius()
-                        if border_radius.is_uniform():
-                            canvas.clip_rrect(RoundRect.from_rect(rect, x=border_radius.top_left, y=border_radius.top_left))
-                        else:
-                            path = draw_manual_rounded_rect_path(rect, border_radius)
-                            canvas.clip_path(path)
-                    else:
-                        canvas.clip_rect(rect)
-        return clip_count
+        if node.clip_region:
+            return node.clip_region.apply(canvas, transforms.offset if transforms else None)
+        return 0
 
     def restore_clip_regions(self, canvas: SkiaCanvas, clip_count: int):
         for _ in range(clip_count):
@@ -770,6 +933,12 @@ class Tree(TreeType):
                 self.restore_clip_regions(canvas, clip_count)
 
     def on_draw_decorator_canvas(self, canvas: SkiaCanvas):
+        if self.layout_worker.is_busy():
+            # Decorations read node geometry, and finishing here would end
+            # the render waiting on the layout. The commit redraws them.
+            if self.decorator_static_layer is not None:
+                self.decorator_static_layer.replay(canvas)
+            return
         try:
             if not self.render_manager.is_destroying:
                 draw_canvas = canvas
@@ -791,13 +960,16 @@ class Tree(TreeType):
                     self.draw_resize_ghost(draw_canvas)
                     canvas.paint.color = "FFFFFF"
                     self.draw_text_mutations(draw_canvas, Point2d(0, 0)) # Why does 0,0 work here?
-                    if self.interactive_node_list or self.draggable_node:
-                        if state_manager.is_focus_visible():
-                            self.draw_focus_outline(draw_canvas, offset)
-                        if self.show_hints:
-                            self.draw_hints(draw_canvas, transforms)
-                    self.init_key_controls()
-                    self.draw_blockable_canvases()
+                    hints = self.get_hints()
+                    self.get_decorator_static_layer(offset, hints, transforms).replay(draw_canvas)
+                    # Hints of decoration rendered nodes follow their
+                    # highlight and transition colors, so they're drawn per draw
+                    self.draw_hints(draw_canvas, [
+                        (node, hint) for node, hint in hints if node.uses_decoration_render
+                    ], transforms)
+                    if not self.is_decorator_paint_only():
+                        self.init_key_controls()
+                        self.draw_blockable_canvases()
                     self.on_fully_rendered()
                 finally:
                     state_manager.set_processing_tree(None)
@@ -808,8 +980,44 @@ class Tree(TreeType):
             self.finish_current_render()
             self.destroy()
 
+    def draw_decorator_static(self, canvas: SkiaCanvas, offset: Point2d, static_hints: list, transforms: RenderTransforms = None):
+        if self.interactive_node_list or self.draggable_node:
+            if state_manager.is_focus_visible():
+                self.draw_focus_outline(canvas, offset)
+            self.draw_hints(canvas, static_hints, transforms)
+
+    def get_decorator_static_layer(self, offset: Point2d, hints: list, transforms: RenderTransforms = None) -> DisplayList:
+        """
+        Focus outline and hints of nodes drawn on the base canvas change
+        rarely compared to hover highlights and text mutations, so they're
+        recorded into a display list and replayed on top of the other
+        decorations until focus, hints, layout or the drag offset change.
+        """
+        static_hints = [(node, hint) for node, hint in hints if not node.uses_decoration_render]
+        key = (
+            self.display_list,
+            tuple((node.id, hint) for node, hint in static_hints),
+            state_manager.is_focus_visible(),
+            state_manager.get_focused_node(),
+            offset.x,
+            offset.y,
+        )
+        if self.decorator_static_layer is None or key != self.decorator_static_key:
+            self.decorator_static_layer = record_display_list([
+                RenderItem(None, lambda c: self.draw_decorator_static(c, offset, static_hints, transforms))
+            ])
+            self.decorator_static_key = key
+        return self.decorator_static_layer
+
+    def is_decorator_paint_only(self) -> bool:
+        return self.render_manager.render_cause in DECORATOR_PAINT_ONLY_CAUSES \
+            and self.is_key_controls_init \
+            and self.is_blockable_canvas_init
+
     def on_draw_base_canvas_dragging(self, canvas: SkiaCanvas):
         try:
+            if self.render_manager.is_drag_start():
+                self.snapshot_base_canvas()
             self.move_canvas(canvas)
             self.move_inputs()
         except Exception as e:
@@ -820,6 +1028,7 @@ class Tree(TreeType):
 
     def on_draw_base_canvas_drag_end(self, canvas: SkiaCanvas):
         try:
+            self.clear_base_snapshot()
             self.root_node.v2_reposition()
             self.compute_clip_regions_cache()
             self.build_base_render_layers()
@@ -832,11 +1041,19 @@ class Tree(TreeType):
 
     def on_draw_base_canvas_scroll(self, canvas: SkiaCanvas):
         try:
-            self.reset_cursor()
-            self.root_node.v2_layout(self.cursor_v2)
-            self.nonlayout_flow()
-            self.compute_clip_regions_cache()
-            self.build_base_render_layers()
+            scrolled_nodes = self.scroll_layout()
+            if scrolled_nodes is None:
+                self.reset_cursor()
+                self.root_node.v2_layout(self.cursor_v2)
+                self.nonlayout_flow()
+                self.compute_clip_regions_cache()
+                self.build_base_render_layers()
+            else:
+                # Render list is unchanged by scrolling, only positions moved
+                self.nonlayout_flow()
+                for node in scrolled_nodes:
+                    self.compute_clip_regions_cache(node)
+                self.invalidate_display_list()
             self.commit_base_canvas()
         except Exception as e:
             print(f"Error during scroll rendering: {e}")
@@ -846,9 +1063,22 @@ class Tree(TreeType):
 
     def on_draw_base_canvas_cursor_update(self, canvas: SkiaCanvas):
         try:
-            self.nonlayout_flow()
-            self.build_base_render_layers()
-            self.commit_base_canvas()
+            # Only the offset changes while following the pointer, so the
+            # layers are rasterized once and blitted at the new position
+            # until a render with any other cause clears the snapshot.
+            if not self.last_base_snapshot:
+                self.nonlayout_flow()
+                self.build_base_render_layers()
+                self.snapshot_base_canvas()
+            if self.last_base_snapshot:
+                rect = self.last_base_snapshot_rect
+                canvas.draw_image(
+                    self.last_base_snapshot,
+                    rect.x + self.cursor_position.x,
+                    rect.y + self.cursor_position.y
+                )
+            else:
+                self.commit_base_canvas()
         except Exception as e:
             print(f"Error during cursor update rendering: {e}")
             log_trace()
@@ -857,6 +1087,10 @@ class Tree(TreeType):
 
     def on_draw_base_canvas_animation_frame(self, canvas: SkiaCanvas):
         try:
+            changed_node_ids, layout_changed = self.transition_manager.consume_changes()
+            if changed_node_ids and not layout_changed \
+                    and self.commit_base_canvas_damaged(changed_node_ids):
+                return
             self.reset_cursor()
             self.root_node.v2_measure_intrinsic_size(canvas)
             self.root_node.v2_grow_size()
@@ -872,13 +1106,10 @@ class Tree(TreeType):
             self.finish_current_render()
             self.destroy()
 
-    def on_draw_base_canvas_default(self, canvas: SkiaCanvas):
+    def on_draw_base_canvas_resize_layout(self, canvas: SkiaCanvas):
+        """Layout only preview while resizing, no component or effect processing"""
         try:
             self.reset_cursor()
-            self.init_node_hierarchy(self.root_node)
-            self.transition_manager.apply_pending_mount_values()
-            self.consume_components()
-            self.consume_effects()
             self.root_node.v2_measure_intrinsic_size(canvas)
             self.root_node.v2_grow_size()
             self.root_node.v2_constrain_size()
@@ -887,25 +1118,80 @@ class Tree(TreeType):
             self.compute_clip_regions_cache()
             self.build_base_render_layers()
             self.commit_base_canvas()
-            # Start mount animations immediately after base canvas commits,
-            # since mount_style values are already visible at this point.
-            # Waiting for the decorator canvas roundtrip adds ~150-300ms delay.
-            if not self.is_mounted:
-                self.transition_manager.start_mount_animations()
-            # Set up cursor refresh cycle after tree is fully processed
-            self.setup_cursor_refresh_cycle()
+        except Exception as e:
+            print(f"Error during resize layout rendering: {e}")
+            log_trace()
+            self.finish_current_render()
+            self.destroy()
+
+    def prepare_layout(self):
+        self.reset_cursor()
+        self.init_node_hierarchy(self.root_node)
+        self.transition_manager.apply_pending_mount_values()
+        self.consume_components()
+        self.consume_effects()
+
+    def compute_layout(self, canvas: SkiaCanvas = None):
+        """Measure, size and position the node tree. Doesn't draw"""
+        self.root_node.v2_measure_intrinsic_size(canvas)
+        self.root_node.v2_grow_size()
+        self.root_node.v2_constrain_size()
+        self.root_node.v2_layout(self.cursor_v2)
+        self.nonlayout_flow()
+        self.compute_clip_regions_cache()
+
+    def commit_layout(self):
+        self.build_base_render_layers()
+        self.commit_base_canvas()
+        # Start mount animations immediately after base canvas commits,
+        # since mount_style values are already visible at this point.
+        # Waiting for the decorator canvas roundtrip adds ~150-300ms delay.
+        if not self.is_mounted:
+            self.transition_manager.start_mount_animations()
+        # Set up cursor refresh cycle after tree is fully processed
+        self.setup_cursor_refresh_cycle()
+
+    def on_draw_base_canvas_default(self, canvas: SkiaCanvas):
+        try:
+            if self.layout_ready:
+                # Already laid out by the layout worker
+                self.layout_ready = False
+            else:
+                self.prepare_layout()
+                self.compute_layout(canvas)
+            self.commit_layout()
         except Exception as e:
             print(f"Error during base canvas draw: {e}")
             log_trace()
             self.finish_current_render()
             self.destroy()
 
+    def on_draw_base_canvas_layout_pending(self, canvas: SkiaCanvas):
+        """
+        The node tree is being laid out off thread, so keep showing the last
+        frame. Recorded ops don't reference nodes, so replaying them is safe.
+        """
+        if self.last_base_snapshot:
+            rect = self.last_base_snapshot_rect
+            offset = self.cursor_position if self.has_cursor_node else Point2d(0, 0)
+            canvas.draw_image(self.last_base_snapshot, rect.x + offset.x, rect.y + offset.y)
+        elif self.display_list is not None:
+            offset = self.cursor_position if self.has_cursor_node else None
+            self.display_list.replay(canvas, offset)
+
     def on_draw_base_canvas(self, canvas: SkiaCanvas):
+        if self.layout_worker.is_busy():
+            self.on_draw_base_canvas_layout_pending(canvas)
+            return
         if not self.render_manager.is_destroying:
             self.current_base_canvas = canvas
             state_manager.set_processing_tree(self)
             try:
                 dragging = self.render_manager.is_dragging() or self.render_manager.is_drag_start()
+                cursor_update = self.render_manager.is_cursor_update() and not (
+                    self.render_manager.render_cause == RenderCause.STATE_CHANGE or
+                    self.render_manager.render_cause == RenderCause.REF_CHANGE
+                )
                 if dragging:
                     self.on_draw_base_canvas_dragging(canvas)
                 elif self.is_drag_end():
@@ -914,11 +1200,17 @@ class Tree(TreeType):
                     self.on_draw_base_canvas_scroll(canvas)
                 elif self.render_manager.is_animation_frame():
                     self.on_draw_base_canvas_animation_frame(canvas)
-                elif self.render_manager.is_cursor_update() and not (self.render_manager.render_cause == RenderCause.STATE_CHANGE or self.render_manager.render_cause == RenderCause.REF_CHANGE):
+                elif self.render_manager.is_resize_layout():
+                    self.on_draw_base_canvas_resize_layout(canvas)
+                elif cursor_update:
                     self.on_draw_base_canvas_cursor_update(canvas)
                 else:
                     self.on_draw_base_canvas_default(canvas)
 
+                if self.has_cursor_node and not cursor_update and not dragging:
+                    # Anything else may have changed what follows the pointer
+                    self.clear_base_snapshot()
+
                 if not dragging:
                     self.show_inputs()
                 self.render_decorator_canvas()
@@ -929,7 +1221,7 @@ class Tree(TreeType):
         transforms = RenderTransforms(offset=offset) if offset.x or offset.y else None
         clip_count = self.apply_clip_regions(canvas, node, transforms)
 
-        rect = node.box_model.visible_rect
+        rect = node.box_model.visible_rect.copy()
         rect.x += offset.x
         rect.y += offset.y
         canvas.paint.color = color or node.properties.highlight_color
@@ -975,13 +1267,27 @@ class Tree(TreeType):
     def finish_current_render(self):
         self.render_manager.finish_current_render()
 
-    def draw_hints(self, canvas: SkiaCanvas, transforms: RenderTransforms = None):
-        if self.meta_state.inputs or self.meta_state.buttons:
-            hint_tag_enable()
-            hint_generator = get_hint_generator()
-            for node in list(self.meta_state.id_to_node.values()):
-                if node.element_type in ["button", "input_text", "link"] and not node.disabled:
-                    draw_hint(canvas, node, hint_generator(node), transforms=transforms)
+    def get_hints(self) -> list[tuple[NodeType, str]]:
+        """
+        (node, hint) for every hintable node when hints are shown. Runs every
+        decorator draw, so hints are assigned in node order and the hint tag
+        is enabled even when the drawn hints are replayed from a cache.
+        """
+        if not self.show_hints or not (self.interactive_node_list or self.draggable_node):
+            return []
+        if not (self.meta_state.inputs or self.meta_state.buttons):
+            return []
+        hint_tag_enable()
+        hint_generator = get_hint_generator()
+        return [
+            (node, hint_generator(node))
+            for node in list(self.meta_state.id_to_node.values())
+            if node.element_type in ["button", "input_text", "link"] and not node.disabled
+        ]
+
+    def draw_hints(self, canvas: SkiaCanvas, hints: list[tuple[NodeType, str]], transforms: RenderTransforms = None):
+        for node, hint in hints:
+            draw_hint(canvas, node, hint, transforms=transforms)
 
     def refresh_decorator_canvas(self):
         if self.canvas_decorator:
@@ -1160,6 +1466,9 @@ class Tree(TreeType):
         return CanvasWeakRef(self.Canvas.from_rect(safe_rect))
 
     def render_decorator_canvas(self):
+        if self.layout_worker.is_busy():
+            # Drawn when the layout is committed
+            return
         if not self.canvas_decorator and not self.render_manager.is_destroying:
             self.canvas_decorator = self.create_canvas()
             self.canvas_decorator.register("draw", self.on_draw_decorator_canvas)
@@ -1195,7 +1504,10 @@ class Tree(TreeType):
             if self.is_mounted:
                 self.on_state_change_effect_cleanups()
                 self.meta_state.clear_nodes()
+                previous_root_node = self.root_node
                 self.init_tree_constructor()
+                if previous_root_node and previous_root_node is not self.root_node:
+                    self.node_pool.release(previous_root_node)
 
             if on_mount or on_unmount:
                 state_manager.register_effect(Effect(
@@ -1208,7 +1520,62 @@ class Tree(TreeType):
             if show_hints is not None:
                 self.show_hints = show_hints
 
-            self.render_base_canvas()
+            # Only renders started by the render manager keep other renders
+            # queued while the layout is in flight
+            if self.threaded_layout and self.render_manager.is_rendering:
+                self.render_layout_threaded()
+            else:
+                self.render_base_canvas()
+
+    def render_layout_threaded(self):
+        """
+        Prepares the new node tree on the main thread (hierarchy, components,
+        effects), lays it out on the layout worker, and only draws the
+        finished layout on the main thread.
+        """
+        state_manager.set_processing_tree(self)
+        try:
+            self.prepare_layout()
+            # Text mutations and font lookups touch shared state, so text is
+            # measured here and the worker only reuses the measurements
+            self.root_node.v2_measure_text()
+            scale = get_scale()
+        except Exception as e:
+            print(f"Error during layout: {e}")
+            log_trace()
+            self.finish_current_render()
+            self.destroy()
+            return
+        finally:
+            state_manager.set_processing_tree(None)
+
+        def layout():
+            set_layout_thread_scale(scale)
+            try:
+                self.compute_layout()
+            finally:
+                set_layout_thread_scale(None)
+
+        self.layout_worker.submit(layout, self.on_layout_done)
+
+    def on_layout_done(self, error: Exception):
+        if self.render_manager.is_destroying:
+            return
+        if error:
+            print(f"Error during layout: {error}")
+            self.finish_current_render()
+            self.destroy()
+            return
+        self.layout_ready = True
+        self.render_base_canvas()
+        self.replay_pending_mouse_events()
+
+    def replay_pending_mouse_events(self):
+        """Mouse events that arrived during an off thread layout, against the new layout"""
+        events = self.pending_mouse_events
+        self.pending_mouse_events = []
+        for e in events:
+            self.on_mouse(e)
 
     def render_animation_frame(self):
         if not self.destroying:
@@ -1230,39 +1597,63 @@ class Tree(TreeType):
     def hide(self):
         self.destroy()
 
+    def add_effect(self, effect: Effect):
+        key = id(effect)
+        self.effects[key] = effect
+        for dependency in effect.dependencies or []:
+            self.effects_by_dependency[dependency][key] = effect
+        if effect.component and effect.component.id:
+            self.effects_by_component[effect.component.id][key] = effect
+
+    def remove_effect(self, effect: Effect):
+        key = id(effect)
+        self.effects.pop(key, None)
+        for dependency in effect.dependencies or []:
+            dependents = self.effects_by_dependency.get(dependency)
+            if dependents:
+                dependents.pop(key, None)
+                if not dependents:
+                    del self.effects_by_dependency[dependency]
+
     def on_state_change_effect_callbacks(self):
+        mount_effects = [
+            effect
+            for component_id in self.meta_state.new_component_ids
+            for effect in self.effects_by_component.get(component_id, {}).values()
+        ]
         for state in state_manager.get_processing_states():
-            for effect in self.effects:
-                component_mount = effect.component and effect.component.id in self.meta_state.new_component_ids
-                if component_mount or state in effect.dependencies:
-                    if len(inspect.signature(effect.callback).parameters) == 1:
-                        effect.callback(StateEvent())
-                    else:
-                        effect.callback()
+            dependents = self.effects_by_dependency.get(state, {})
+            effects = list(dependents.values()) + [
+                effect for effect in mount_effects if id(effect) not in dependents
+            ]
+            for effect in effects:
+                if get_param_count(effect.callback) == 1:
+                    effect.callback(StateEvent())
+                else:
+                    effect.callback()
 
     def on_state_change_effect_cleanups(self):
         for state in state_manager.get_processing_states():
-            for effect in reversed(self.effects):
-                if state in effect.dependencies:
-                    if effect.cleanup:
-                        if len(inspect.signature(effect.cleanup).parameters) == 1:
-                            effect.cleanup(StateEvent())
-                        else:
-                            effect.cleanup()
+            for effect in reversed(list(self.effects_by_dependency.get(state, {}).values())):
+                if effect.cleanup:
+                    if get_param_count(effect.cleanup) == 1:
+                        effect.cleanup(StateEvent())
+                    else:
+                        effect.cleanup()
 
     def on_component_unmount_effect_cleanups(self):
-        for state in state_manager.get_processing_states():
-            effects_to_keep = []
-            for effect in reversed(self.effects):
-                if effect.cleanup and effect.component and effect.component.id in self.meta_state.removed_component_ids:
-                    if len(inspect.signature(effect.cleanup).parameters) == 1:
+        for component_id in self.meta_state.removed_component_ids:
+            component_effects = self.effects_by_component.pop(component_id, None)
+            if not component_effects:
+                continue
+            for effect in reversed(list(component_effects.values())):
+                self.remove_effect(effect)
+                if effect.cleanup:
+                    if get_param_count(effect.cleanup) == 1:
                         effect.cleanup(StateEvent())
                     else:
                         effect.cleanup()
-                else:
-                    effects_to_keep.append(effect)
-            self.effects = list(reversed(effects_to_keep))
-            self.meta_state.removed_component_ids.clear()
+        self.meta_state.removed_component_ids.clear()
 
     def on_fully_rendered(self):
         if not self.render_manager.is_destroying:
@@ -1271,16 +1662,16 @@ class Tree(TreeType):
                     self.on_state_change_effect_callbacks()
                 elif self.render_manager.render_cause == RenderCause.DRAG_END:
                     if self.draggable_node and self.draggable_node.properties and self.draggable_node.properties.on_drag_end:
-                        if len(inspect.signature(self.draggable_node.properties.on_drag_end).parameters) == 1:
+                        if get_param_count(self.draggable_node.properties.on_drag_end) == 1:
                             self.draggable_node.properties.on_drag_end(StateEvent())
                         else:
                             self.draggable_node.properties.on_drag_end()
             else:
                 self.is_mounted = True
 
-                for effect in self.effects:
+                for effect in list(self.effects.values()):
                     if effect.callback:
-                        if len(inspect.signature(effect.callback).parameters) == 1:
+                        if get_param_count(effect.callback) == 1:
                             cleanup = effect.callback(StateEvent())
                         else:
                             cleanup = effect.callback()
@@ -1347,11 +1738,13 @@ class Tree(TreeType):
             node = self.meta_state.id_to_node.get(node_id)
             if node and node.box_model:
                 if node.box_model.scroll_bar_thumb_rect and node.box_model.scroll_bar_thumb_rect.contains(gpos):
+                    self.scroll_input.cancel(node_id)
                     self.meta_state.start_scrollbar_drag(node_id, gpos.y, scrollable_data.offset_y, axis="y")
                     self.render_manager.pause()
                     self.render_base_canvas()
                     return True
                 if node.box_model.scroll_bar_x_thumb_rect and node.box_model.scroll_bar_x_thumb_rect.contains(gpos):
+                    self.scroll_input.cancel(node_id)
                     self.meta_state.start_scrollbar_drag(node_id, gpos.x, scrollable_data.offset_x, axis="x")
                     self.render_manager.pause()
                     self.render_base_canvas()
@@ -1494,8 +1887,38 @@ class Tree(TreeType):
             new_h = max_h
 
         ms.resize_ghost_rect = Rect(new_x, new_y, new_w, new_h)
+
+        if self.resize_layout_interval > 0:
+            now = time.monotonic()
+            if (now - self.last_resize_layout_time) * 1000 >= self.resize_layout_interval:
+                self.last_resize_layout_time = now
+                node = ms.id_to_node.get(ms.resize_dragging_id)
+                if node:
+                    node.properties.update_overrides(self.apply_resize_overrides(node.id, ms.resize_ghost_rect))
+                    self.apply_resize_drag_offset(node, ms.resize_ghost_rect)
+                    # Base render redraws the decorator canvas (and ghost) too
+                    self.render_manager.render_resize_layout()
+                    return
+
         self.render_manager.render_resize_ghost()
 
+    def apply_resize_overrides(self, node_id: str, ghost: Rect) -> dict[str, float]:
+        """Store the ghost size as ref property overrides and return them (unscaled)."""
+        # Unscale ghost dimensions since update_property will re-scale
+        scale = get_scale() or 1.0
+        unscaled_w = ghost.width / scale
+        unscaled_h = ghost.height / scale
+        overrides = {
+            "width": unscaled_w,
+            "height": unscaled_h,
+            # Also cap max so layout can't expand beyond resized size
+            "max_width": unscaled_w,
+            "max_height": unscaled_h,
+        }
+        for property_name, value in overrides.items():
+            self.meta_state.set_ref_property_override(node_id, property_name, value)
+        return overrides
+
     def _compute_resize_layout_compensation(self, node, old_width, old_height, new_width, new_height):
         """Compute drag offset adjustment to counteract layout repositioning after resize.
 
@@ -1531,6 +1954,30 @@ class Tree(TreeType):
 
         return Point2d(comp_x, comp_y)
 
+    def apply_resize_drag_offset(self, node, ghost: Rect):
+        """
+        Position the resized window where the ghost is. The left/top edge
+        movement plus layout compensation is applied relative to the drag
+        offset at resize start, so live layout frames and the final layout
+        land in the same place.
+        """
+        ms = self.meta_state
+        start_offset = ms.resize_start_drag_offset
+        if start_offset is None:
+            return
+        start_rect = ms.resize_start_rect
+
+        # Compensate for layout repositioning (e.g. centering shifts)
+        compensation = self._compute_resize_layout_compensation(
+            node, start_rect.width, start_rect.height, ghost.width, ghost.height
+        )
+
+        # Combine left/top edge movement + layout compensation
+        ms._draggable_offset[node.id] = Point2d(
+            start_offset.x + (ghost.x - start_rect.x) + compensation.x,
+            start_offset.y + (ghost.y - start_rect.y) + compensation.y,
+        )
+
     def handle_resize_mouseup(self, gpos):
         """Apply final size from resize ghost and resume rendering."""
         ms = self.meta_state
@@ -1539,39 +1986,17 @@ class Tree(TreeType):
         node = ms.id_to_node.get(node_id)
 
         if node and ghost:
-            start_rect = ms.resize_start_rect
-
-            # Unscale ghost dimensions since update_property will re-scale
-            scale = get_scale() or 1.0
-            unscaled_w = ghost.width / scale
-            unscaled_h = ghost.height / scale
-
-            ms.set_ref_property_override(node_id, "width", unscaled_w)
-            ms.set_ref_property_override(node_id, "height", unscaled_h)
-            # Also cap max so layout can't expand beyond resized size
-            ms.set_ref_property_override(node_id, "max_width", unscaled_w)
-            ms.set_ref_property_override(node_id, "max_height", unscaled_h)
-
-            # Compensate for layout repositioning (e.g. centering shifts)
-            compensation = self._compute_resize_layout_compensation(
-                node, start_rect.width, start_rect.height, ghost.width, ghost.height
-            )
-
-            # Combine left/top edge movement + layout compensation
-            offset_dx = (ghost.x - start_rect.x) + compensation.x
-            offset_dy = (ghost.y - start_rect.y) + compensation.y
-            if offset_dx != 0 or offset_dy != 0:
-                if node_id in ms._draggable_offset:
-                    ms._draggable_offset[node_id] = Point2d(
-                        ms._draggable_offset[node_id].x + offset_dx,
-                        ms._draggable_offset[node_id].y + offset_dy,
-                    )
+            overrides = self.apply_resize_overrides(node_id, ghost)
+            unscaled_w = overrides["width"]
+            unscaled_h = overrides["height"]
+            self.apply_resize_drag_offset(node, ghost)
 
             # Save dimensions for persistence (unscaled)
             if hasattr(node, 'save_resize_dimensions'):
                 node.save_resize_dimensions(unscaled_w, unscaled_h)
 
         ms.clear_resize_drag()
+        self.last_resize_layout_time = 0
         self.destroy_blockable_canvas()
         self.render_manager.resume()
         self.render_base_canvas()
@@ -1633,7 +2058,7 @@ class Tree(TreeType):
                             self.unhighlight_no_render(prev_hovered_id)
                             state_manager.set_hovered_id(None)
                         self.render_manager.render_mouse_highlight()
-                    if not self.hover_validation_job:
+                    if not self.is_hover_validation_scheduled():
                         self.schedule_hover_validation()
                     return
                 elif prev_resize_hover:
@@ -1658,7 +2083,7 @@ class Tree(TreeType):
                                 changed = True
                                 self.unhighlight_no_render(prev_hovered_id)
                                 self.highlight_no_render(target_id, color=target_node.properties.highlight_color)
-                                if not self.hover_validation_job:
+                                if not self.is_hover_validation_scheduled():
                                     self.schedule_hover_validation()
                             break
 
@@ -1772,7 +2197,7 @@ class Tree(TreeType):
                 self.meta_state.set_highlighted(hovered_id, active_color)
                 self.render_manager.render_mouse_highlight()
                 # Schedule validation in case mouse teleports away after click
-                if not self.hover_validation_job:
+                if not self.is_hover_validation_scheduled():
                     self.schedule_hover_validation()
                 return
 
@@ -1792,8 +2217,7 @@ class Tree(TreeType):
     def click_node(self, node: NodeType):
         if node and getattr(node, 'on_click', None):
             try:
-                sig = inspect.signature(node.on_click)
-                if len(sig.parameters) == 0:
+                if get_param_count(node.on_click) == 0:
                     node.on_click()
                 else:
                     node.on_click(ClickEvent(id=node.id))
@@ -1944,6 +2368,15 @@ class Tree(TreeType):
     def on_mouse(self, e: MouseEvent):
         if self.unmounting:
             return
+        if self.layout_worker.is_busy():
+            # Replayed once the layout is committed. Only the latest move
+            # matters, but presses and releases must all arrive.
+            if e.event == "mousemove" and self.pending_mouse_events \
+                    and self.pending_mouse_events[-1].event == "mousemove":
+                self.pending_mouse_events[-1] = e
+            else:
+                self.pending_mouse_events.append(e)
+            return
         if not state_manager.are_mouse_events_disabled() and \
                 not self.render_manager.is_destroying:
             self.last_mouse_event_time = time.time()
@@ -1973,14 +2406,14 @@ class Tree(TreeType):
 
             if smallest_node:
                 scrollable_data = self.meta_state.scrollable[smallest_node.id]
-                did_scroll = False
+                offset_x = 0
+                offset_y = 0
 
                 # Vertical scroll
                 max_height = smallest_node.box_model.content_children_with_padding_size.height
                 view_height = smallest_node.box_model.padding_size.height
 
                 if max_height > view_height:
-                    offset_y = 0
                     # mouse wheel
                     if abs(e.degrees.y) > 1e-5:
                         offset_y = self.scroll_amount_per_tick if e.degrees.y > 0 else -self.scroll_amount_per_tick
@@ -1989,19 +2422,14 @@ class Tree(TreeType):
                         offset_y = e.pixels.y
 
                     if offset_y:
-                        new_offset_y = scrollable_data.offset_y + offset_y
-                        new_offset_y = max(view_height - max_height, min(0, new_offset_y))
-                        scrollable_data.offset_y = new_offset_y
                         scrollable_data.view_height = view_height
                         scrollable_data.max_height = max_height
-                        did_scroll = True
 
                 # Horizontal scroll
                 max_width = smallest_node.box_model.content_children_with_padding_size.width
                 view_width = smallest_node.box_model.padding_size.width
 
                 if max_width > view_width:
-                    offset_x = 0
                     degrees_x = getattr(e.degrees, 'x', 0) if hasattr(e.degrees, 'x') else 0
                     pixels_x = getattr(e.pixels, 'x', 0) if hasattr(e.pixels, 'x') else 0
 
@@ -2013,15 +2441,12 @@ class Tree(TreeType):
                         offset_x = pixels_x
 
                     if offset_x:
-                        new_offset_x = scrollable_data.offset_x + offset_x
-                        new_offset_x = max(view_width - max_width, min(0, new_offset_x))
-                        scrollable_data.offset_x = new_offset_x
                         scrollable_data.view_width = view_width
                         scrollable_data.max_width = max_width
-                        did_scroll = True
 
-                if did_scroll:
-                    self.render_manager.render_scroll()
+                if offset_x or offset_y:
+                    # Applied once per frame, see ScrollInput
+                    self.scroll_input.add(smallest_node.id, offset_x, offset_y)
 
     def on_scroll(self, e):
         if self.unmounting:
@@ -2037,7 +2462,7 @@ class Tree(TreeType):
                 node = self.meta_state.id_to_node.get(id)
                 if node and node.on_close and not node.destroying:
                     try:
-                        if len(inspect.signature(node.on_close).parameters) == 1:
+                        if get_param_count(node.on_close) == 1:
                             node.on_close(WindowCloseEvent(hide=hide))
                         else:
                             node.on_close()
@@ -2084,7 +2509,6 @@ class Tree(TreeType):
         self.destroy()
 
     def destroy(self):
-        global scroll_throttle_job
         if not self.destroying:
             if not self.unmounting and self._has_unmount_animations():
                 self._start_unmount()
@@ -2098,14 +2522,14 @@ class Tree(TreeType):
             # Defer effect cleanups to avoid recursive action errors when
             # a cleanup calls ui_elements_hide for another tree
             deferred_cleanups = []
-            for effect in reversed(self.effects):
+            for effect in reversed(list(self.effects.values())):
                 if effect.cleanup:
                     deferred_cleanups.append(effect.cleanup)
             if deferred_cleanups:
                 def run_deferred_cleanups():
                     for cleanup in deferred_cleanups:
                         try:
-                            if len(inspect.signature(cleanup).parameters) == 1:
+                            if get_param_count(cleanup) == 1:
                                 cleanup(StateEvent())
                             else:
                                 cleanup()
@@ -2119,9 +2543,7 @@ class Tree(TreeType):
                 self.render_debounce_job = None
 
             self.stop_cursor_refresh_cycle()
-            if self.hover_validation_job:
-                cron.cancel(self.hover_validation_job)
-                self.hover_validation_job = None
+            self.scheduler.cancel("hover_validation")
             self.cursor_position = None
             self.cursor_refresh_rate = DEFAULT_CURSOR_REFRESH_RATE
             self.has_cursor_node = False
@@ -2144,11 +2566,19 @@ class Tree(TreeType):
 
             self._tree_constructor = None
             self.current_base_canvas = None
+            self.layout_worker.cancel()
+            self.layout_ready = False
+            self.pending_mouse_events.clear()
+            self.scroll_input.destroy()
+            self.node_pool.clear()
             self.transition_manager.destroy()
+            self.scheduler.destroy()
             self.render_manager.destroy()
             state_manager.clear_state_for_tree(self)
             self.meta_state.clear()
             self.effects.clear()
+            self.effects_by_dependency.clear()
+            self.effects_by_component.clear()
             self.processing_states.clear()
             self.is_mounted = False
             self.interactive_node_list.clear()
@@ -2160,9 +2590,11 @@ class Tree(TreeType):
             self.draggable_node_delta_pos = None
             self.absolute_nodes.clear()
             self.fixed_nodes.clear()
-            scroll_throttle_job = None
             self.render_list.clear()
             self.render_layers.clear()
+            self.invalidate_display_list()
+            self.decorator_static_layer = None
+            self.decorator_static_key = None
             # Only clear hint state if no other trees have hints
             has_other_trees_with_hints = any(
                 tree != self and (tree.meta_state.inputs or tree.meta_state.buttons)
@@ -2172,6 +2604,7 @@ class Tree(TreeType):
                 hint_clear_state()
             self.render_cause.clear()
             self.last_base_snapshot = None
+            self.last_base_snapshot_rect = None
             self.last_hints_snapshot = None
             state_manager.clear_tree(self)
             self.destroying = False
@@ -2374,6 +2807,7 @@ class Tree(TreeType):
         current_node.depth = len(node_index_path)
         current_node.node_index_path = node_index_path
 
+        current_node.cascade = None
         if getattr(current_node, 'parent_node', None):
             current_node.inherit_cascaded_properties(current_node.parent_node)
         self._assign_dragging_node_and_handle(current_node)
@@ -2399,7 +2833,7 @@ class Tree(TreeType):
     def consume_effects(self):
         for effect in list(store.staged_effects):
             if effect.tree == self or effect.tree is None:
-                self.effects.append(effect)
+                self.add_effect(effect)
                 store.staged_effects.remove(effect)
 
     def consume_components(self):
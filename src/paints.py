@@ -0,0 +1,82 @@
+from talon.skia.paint import Paint
+from talon.skia.imagefilter import ImageFilter
+from .fonts import get_typeface
+
+PAINT_REGISTRY_SIZE = 512
+
+class PaintRegistry:
+    """
+    Interned, prebuilt Paint objects keyed by their configuration.
+
+    Draw code asks for a paint per primitive instead of mutating the
+    canvas paint (color, style, stroke width, image filter) before every
+    draw, or allocating a new Paint per text draw. Returned paints are
+    shared and must not be mutated.
+    """
+    def __init__(self):
+        self.paints: dict[tuple, Paint] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        color: str,
+        stroke_width: float = None,
+        textsize: float = None,
+        font_family: str = None,
+        font_weight: str = None,
+        drop_shadow: tuple = None,
+    ) -> Paint:
+        """FILL style unless `stroke_width` is given"""
+        key = (color, stroke_width, textsize, font_family, font_weight, drop_shadow)
+        paint = self.paints.get(key)
+        if paint is not None:
+            self.hits += 1
+            return paint
+
+        self.misses += 1
+        paint = Paint()
+        paint.color = color
+        if stroke_width is not None:
+            paint.style = paint.Style.STROKE
+            paint.stroke_width = stroke_width
+        else:
+            paint.style = paint.Style.FILL
+        if textsize is None:
+            paint.antialias = True
+        else:
+            paint.textsize = textsize
+            if font_family:
+                typeface = get_typeface(font_family, font_weight)
+                if typeface:
+                    paint.typeface = typeface
+            if font_weight == "bold":
+                paint.font.embolden = True
+        if drop_shadow:
+            paint.imagefilter = ImageFilter.drop_shadow(*drop_shadow[:5])
+
+        if len(self.paints) >= PAINT_REGISTRY_SIZE:
+            self.paints.pop(next(iter(self.paints)))
+        self.paints[key] = paint
+        return paint
+
+    def get_text_paint(self, properties, color: str, stroke_width: float = None) -> Paint:
+        return self.get(
+            color,
+            stroke_width,
+            textsize=properties.font_size,
+            font_family=properties.font_family,
+            font_weight=properties.font_weight,
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            "paints": len(self.paints),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        self.paints.clear()
+
+paint_registry = PaintRegistry()
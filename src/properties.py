@@ -1,5 +1,4 @@
 import hashlib
-import inspect
 import json
 from dataclasses import dataclass
 from talon import app
@@ -29,7 +28,7 @@ from .constants import (
     DEFAULT_FOCUS_OUTLINE_WIDTH,
     ELEMENT_ENUM_TYPE,
 )
-from .utils import hex_color, scale_value, get_scale
+from .utils import hex_color, scale_value, get_scale, get_param_info
 
 # Properties that should be scaled by the global UI scale setting
 SCALABLE_PROPERTIES = {
@@ -371,14 +370,12 @@ class Properties(PropertiesDimensionalType, PropertiesType):
 
             if key == "on_click" and value is not None and callable(value):
                 try:
-                    sig = inspect.signature(value)
-                    params = list(sig.parameters.values())
-                    if len(params) > 0:
-                        first_param = params[0]
+                    param_count, first_param_name, first_param_has_default = get_param_info(value)
+                    if param_count > 0:
                         # Check for common mistake: lambda with default parameter as first arg
-                        if first_param.default != inspect.Parameter.empty and first_param.name != 'e' and first_param.name != 'event':
+                        if first_param_has_default and first_param_name != 'e' and first_param_name != 'event':
                             raise ValueError(
-                                f"on_click function signature error: First parameter '{first_param.name}' "
+                                f"on_click function signature error: First parameter '{first_param_name}' "
                                 f"has a default value, suggesting it might be a captured variable. "
                                 f"The on_click callback receives a ClickEvent as its first parameter. "
                                 f"Correct usage: on_click=lambda e: your_function(captured_var) "
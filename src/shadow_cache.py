@@ -0,0 +1,73 @@
+import math
+from talon.skia import Surface
+from talon.skia.canvas import Canvas as SkiaCanvas
+from talon.types import Rect
+from .border_radius import BorderRadius
+from .node_geometry import RectShape
+from .paints import paint_registry
+
+# Bounded by total pixels, since e.g. resizing a window produces a new size per frame
+SHADOW_CACHE_MAX_PIXELS = 8_000_000
+
+def get_shadow_margin(drop_shadow: tuple) -> int:
+    """How far a drop shadow can paint outside its rect"""
+    offset_x, offset_y, sigma_x, sigma_y = drop_shadow[:4]
+    # Room for the blur (~3 sigma) and the shadow offset on every side
+    return math.ceil(3 * max(sigma_x, sigma_y) + max(abs(offset_x), abs(offset_y))) + 1
+
+class ShadowCache:
+    """
+    Pre-blurred drop shadow images keyed by (size, border radius, drop
+    shadow), so a shadow is blurred once and then composited as an image
+    for every frame and every node of the same shape.
+    """
+    def __init__(self):
+        self.images: dict[tuple, tuple] = {}
+        self.pixels = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _rasterize(self, width: float, height: float, border_radius: BorderRadius, drop_shadow: tuple) -> tuple:
+        """Returns (image, margin, pixels), the image is drawn at rect position - margin"""
+        margin = get_shadow_margin(drop_shadow)
+        surface_width = math.ceil(width + margin * 2)
+        surface_height = math.ceil(height + margin * 2)
+        surface = Surface(surface_width, surface_height)
+        shape = RectShape(Rect(margin, margin, width, height), border_radius)
+        shape.draw(surface.canvas(), paint_registry.get(drop_shadow[4], drop_shadow=drop_shadow))
+        return surface.snapshot(), margin, surface_width * surface_height
+
+    def draw(self, c: SkiaCanvas, rect: Rect, border_radius: BorderRadius, drop_shadow: tuple):
+        key = (
+            rect.width, rect.height,
+            border_radius.top_left, border_radius.top_right,
+            border_radius.bottom_right, border_radius.bottom_left,
+            drop_shadow
+        )
+        entry = self.images.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._rasterize(rect.width, rect.height, border_radius, drop_shadow)
+            self.pixels += entry[2]
+            while self.images and self.pixels > SHADOW_CACHE_MAX_PIXELS:
+                self.pixels -= self.images.pop(next(iter(self.images)))[2]
+            self.images[key] = entry
+        else:
+            self.hits += 1
+
+        image, margin, _ = entry
+        c.draw_image(image, rect.x - margin, rect.y - margin)
+
+    def get_stats(self) -> dict:
+        return {
+            "images": len(self.images),
+            "pixels": self.pixels,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        self.images.clear()
+        self.pixels = 0
+
+shadow_cache = ShadowCache()
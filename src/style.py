@@ -1,11 +1,22 @@
 from .interfaces import StyleType
 
+STYLE_CACHE_MAX = 32
+
 class Style(StyleType):
+    """
+    Compiled style sheet.
+
+    Merged rules are computed once per (element_type, id, class_name)
+    combination and cached until the sheet changes, since every node of
+    every render looks its style up. Returned dicts are shared, treat them
+    as read-only.
+    """
     def __init__(self, style_dict: dict = None):
         self.tags: dict[str, dict] = {}
         self.ids: dict[str, dict] = {}
         self.classes: dict[str, dict] = {}
         self.universal: dict = {}
+        self.compiled: dict[tuple, dict] = {}
         if style_dict:
             self.apply(style_dict)
 
@@ -19,16 +30,42 @@ class Style(StyleType):
                 self.classes[selector[1:]] = props
             else:
                 self.tags[selector] = props
+        self.compiled.clear()
 
-    def get(self, node) -> dict:
+    def compile(self, element_type: str, id: str, class_name: str) -> dict:
         result = {}
-        id = node.id or node.properties.id
         if self.universal:
             result.update(self.universal)
-        if node.element_type in self.tags:
-            result.update(self.tags[node.element_type])
+        if element_type in self.tags:
+            result.update(self.tags[element_type])
         if id and id in self.ids:
             result.update(self.ids[id])
-        if node.properties.class_name and node.properties.class_name in self.classes:
-            result.update(self.classes[node.properties.class_name])
-        return result
\ No newline at end of file
+        if class_name:
+            # Multiple classes are space separated, later rules in the sheet win
+            class_names = set(class_name.split())
+            for name, props in self.classes.items():
+                if name in class_names:
+                    result.update(props)
+        return result
+
+    def get(self, node) -> dict:
+        key = (node.element_type, node.id or node.properties.id, node.properties.class_name)
+        result = self.compiled.get(key)
+        if result is None:
+            result = self.compiled[key] = self.compile(*key)
+        return result
+
+_style_cache: dict[str, Style] = {}
+
+def get_style(style_dict: dict) -> Style:
+    """
+    `style()` runs on every render with an equal dict, so reuse the
+    compiled sheet for it instead of starting with an empty cache.
+    """
+    key = repr(style_dict)
+    style = _style_cache.get(key)
+    if style is None:
+        if len(_style_cache) >= STYLE_CACHE_MAX:
+            _style_cache.clear()
+        style = _style_cache[key] = Style(style_dict)
+    return style
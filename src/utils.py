@@ -1,28 +1,45 @@
 import hashlib
 import inspect
 import re
+import threading
+from functools import lru_cache
 from talon import ui
 from talon.skia.canvas import Canvas as SkiaCanvas
-from talon.skia.paint import Paint
 from talon.skia import RoundRect
 from talon.screen import Screen
 from talon.types import Rect
 from typing import Union, Callable, TypeVar
 from .constants import NAMED_COLORS_TO_HEX
-from .fonts import get_typeface
+from .paints import paint_registry
 from .border_radius import BorderRadius, draw_manual_rounded_rect_path
 
+_store = None
+_layout_thread = threading.local()
+
 def get_scale() -> float:
-    try:
-        # Lazy import to avoid circular dependencies since this is imported by many modules
-        from .core.state_manager import state_manager
-        from .core.store import store
-        processing_tree = state_manager.get_processing_tree()
-        if processing_tree and hasattr(processing_tree, 'scale'):
-            return processing_tree.scale
-        return store.scale
-    except Exception as e:
-        return 1.0
+    """
+    Scale of the tree currently being processed, otherwise the global scale.
+    The tree's scale is resolved once when it becomes the processing tree.
+    """
+    global _store
+    layout_scale = getattr(_layout_thread, "scale", None)
+    if layout_scale is not None:
+        return layout_scale
+    if _store is None:
+        try:
+            # Lazy import to avoid circular dependencies since this is imported by many modules
+            from .core.store import store
+            _store = store
+        except Exception as e:
+            return 1.0
+    return _store.scale_context or _store.scale
+
+def set_layout_thread_scale(scale: Union[float, None]):
+    """Scale for `get_scale` on the calling thread, for layout off the main thread"""
+    _layout_thread.scale = scale
+
+def is_layout_thread() -> bool:
+    return getattr(_layout_thread, "scale", None) is not None
 
 def scale_value(value: Union[int, float]) -> Union[int, float]:
     if value is None:
@@ -35,25 +52,14 @@ def scale_value(value: Union[int, float]) -> Union[int, float]:
         return value
 
 def draw_text_simple(c: SkiaCanvas, text, color, properties, x, y):
-    paint = Paint()
-    paint.textsize = properties.font_size
-    c.paint.antialias = True
-    if properties.font_family:
-        typeface = get_typeface(properties.font_family, properties.font_weight)
-        if typeface:
-            paint.typeface = typeface
-    if properties.font_weight == "bold":
-        paint.font.embolden = True
-
+    text = str(text)
     if properties.stroke_color:
-        paint.style = paint.Style.STROKE
-        paint.color = properties.stroke_color
-        paint.stroke_width = properties.stroke_width or 1
-        c.draw_text(str(text), x, y, paint)
-
-    paint.style = paint.Style.FILL
-    paint.color = color
-    c.draw_text(str(text), x, y, paint)
+        c.draw_text(text, x, y, paint_registry.get_text_paint(
+            properties,
+            properties.stroke_color,
+            stroke_width=properties.stroke_width or 1
+        ))
+    c.draw_text(text, x, y, paint_registry.get_text_paint(properties, color))
 
 def get_screen(index: int = None) -> Screen:
     return ui.main_screen() if index is None else ui.screens()[index]
@@ -82,18 +88,54 @@ def generate_hash(obj: Union[Callable, dict]) -> str:
 
     return hasher.hexdigest()
 
+@lru_cache(maxsize=4096)
 def sanitize_string(text: str) -> str:
     return re.sub(r'[^a-zA-Z0-9_]', '_', text)
 
 E = TypeVar("E")
 
-def safe_callback(callback: Callable[[E], None], event: E) -> None:
+PARAM_COUNT_CACHE_SIZE = 1024
+_param_info_cache: dict[tuple, tuple] = {}
+
+def _read_param_info(callback: Callable) -> tuple[int, str, bool]:
+    params = list(inspect.signature(callback).parameters.values())
+    if not params:
+        return 0, None, False
+    return len(params), params[0].name, params[0].default is not inspect.Parameter.empty
+
+def get_param_info(callback: Callable) -> tuple[int, str, bool]:
+    """
+    (parameter count, first parameter name, first parameter has a default)
+    for `callback`. Cached per code object, since callbacks are checked on
+    every render and call, and inline lambdas are new function objects
+    every render, but share their code.
+    """
+    is_bound_method = inspect.ismethod(callback)
+    func = callback.__func__ if is_bound_method else callback
+    code = getattr(func, "__code__", None)
+    if code is None or hasattr(func, "__wrapped__") or hasattr(func, "__signature__"):
+        # Builtins, partials, callable objects and decorated functions,
+        # where the signature isn't the code's
+        return _read_param_info(callback)
+
+    key = (code, is_bound_method)
+    info = _param_info_cache.get(key)
+    if info is None:
+        info = _read_param_info(callback)
+        if len(_param_info_cache) >= PARAM_COUNT_CACHE_SIZE:
+            _param_info_cache.pop(next(iter(_param_info_cache)))
+        _param_info_cache[key] = info
+    return info
+
+def get_param_count(callback: Callable) -> int:
+    """Number of parameters `callback` accepts"""
+    return get_param_info(callback)[0]
+
+def safe_callback(callback: Callable[[E], None], event: E):
     """If the callback has no parameters, call it without any arguments"""
-    sig = inspect.signature(callback)
-    if len(sig.parameters) == 0:
-        callback()
-    else:
-        callback(event)
+    if get_param_count(callback) == 0:
+        return callback()
+    return callback(event)
 
 def get_center(rect: Rect) -> tuple[int, int]:
     return rect.x + rect.width // 2, rect.y + rect.height // 2
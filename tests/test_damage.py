@@ -0,0 +1,35 @@
+from ..src.damage import DamageRegion, rects_intersect
+from .test_helpers import test_module, it
+from talon.types import Rect
+
+@test_module
+class DamageTests:
+    def test_damage_region(self, done):
+        damage = DamageRegion()
+        it("should start empty", expect=True, actual=damage.is_empty())
+
+        damage.add(Rect(10, 10, 0, 20))
+        it("should ignore empty rects", expect=True, actual=damage.is_empty())
+
+        damage.add(Rect(10.5, 10.5, 20, 20))
+        it("should snap out to whole pixels",
+            expect=(10, 10, 21, 21),
+            actual=(damage.rect.x, damage.rect.y, damage.rect.width, damage.rect.height))
+
+        damage.add(Rect(50, 0, 10, 10))
+        it("should grow to the union of added rects",
+            expect=(10, 0, 50, 31),
+            actual=(damage.rect.x, damage.rect.y, damage.rect.width, damage.rect.height))
+
+        it("should intersect an overlapping rect", expect=True, actual=damage.intersects(Rect(0, 0, 11, 11)))
+        it("should not intersect a touching rect", expect=False, actual=damage.intersects(Rect(0, 0, 10, 10)))
+        it("should not intersect None", expect=False, actual=damage.intersects(None))
+        it("should not intersect when empty", expect=False, actual=DamageRegion().intersects(Rect(0, 0, 10, 10)))
+        done()
+
+    def test_rects_intersect(self, done):
+        it("should intersect overlapping rects", expect=True,
+            actual=rects_intersect(Rect(0, 0, 10, 10), Rect(5, 5, 10, 10)))
+        it("should not intersect disjoint rects", expect=False,
+            actual=rects_intersect(Rect(0, 0, 10, 10), Rect(20, 0, 10, 10)))
+        done()
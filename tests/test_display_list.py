@@ -0,0 +1,111 @@
+from ..src.display_list import DISPLAY_LIST_DRAW_OPS, DISPLAY_LIST_STATE_OPS, record_display_list
+from ..src.entry import render_ui
+from ..src.interfaces import RenderItem
+from ..src.nodes.mocks import MockCanvas
+from .test_helpers import test_module, it, test_truthy
+from talon import actions, cron
+from talon.skia.paint import Paint
+from talon.types import Rect
+
+def display_list_ui():
+    screen, window, div, text, button, icon, table, tr, td = actions.user.ui_elements(
+        ["screen", "window", "div", "text", "button", "icon", "table", "tr", "td"]
+    )
+    svg, path, rect, circle, polyline, polygon, line = actions.user.ui_elements_svg(
+        ["svg", "path", "rect", "circle", "polyline", "polygon", "line"]
+    )
+    return screen()[
+        window(title="Display list")[
+            div(background_color="333333", border_width=1, border_radius=4, drop_shadow=(0, 4, 8, 8, "00000088"))[
+                text("Hello world!"),
+                button("Button"),
+                icon("check"),
+            ],
+            table()[
+                tr()[td("Cell")],
+            ],
+            svg()[
+                path(d="M2 2 L22 22"),
+                rect(x=2, y=2, width=20, height=20, rx=2),
+                circle(cx=12, cy=12, r=10),
+                polyline(points="2 2 12 22 22 2"),
+                polygon(points="2 2 12 22 22 2"),
+                line(x1=2, y1=2, x2=22, y2=22),
+            ],
+        ]
+    ]
+
+def canvas_ops(canvas: MockCanvas) -> list:
+    return [
+        entry[0] for entry in canvas.log
+        if entry[0] in DISPLAY_LIST_DRAW_OPS or entry[0] in DISPLAY_LIST_STATE_OPS
+    ]
+
+def drawn_rects(canvas: MockCanvas) -> list:
+    return [entry[1][0].x for entry in canvas.log if entry[0] == "draw_rect"]
+
+def rect_items(positions: list) -> list:
+    """Render items each drawing a rect at positions[i], read when recorded"""
+    def draw(c, index):
+        c.save()
+        c.draw_rect(Rect(positions[index], 0, 10, 10))
+        c.restore()
+    return [RenderItem(None, lambda c, i=i: draw(c, i)) for i in range(len(positions))]
+
+@test_module
+class DisplayListTests:
+    def test_display_list_replay(self, done):
+        mock_tree = render_ui(display_list_ui, test_mode=True)
+
+        def check(tree=mock_tree):
+            display_list = tree.get_display_list()
+
+            direct_canvas = MockCanvas()
+            direct_canvas.paint = Paint()
+            for item in display_list.items:
+                item.draw(direct_canvas)
+
+            replay_canvas = MockCanvas()
+            display_list.replay(replay_canvas)
+
+            test_truthy("should record a display list", len(display_list) > 0)
+            it("should replay the same canvas calls as drawing directly",
+                expect=canvas_ops(direct_canvas), actual=canvas_ops(replay_canvas))
+            it("should replay keyword arguments",
+                expect=True,
+                actual=any(
+                    entry[0] == "draw_points" and "mode" in entry[2] and "points" in entry[2]
+                    for entry in replay_canvas.log
+                ))
+            tree.destroy()
+            done()
+
+        cron.after("50ms", check)
+
+    def test_display_list_rerecord(self, done):
+        positions = [0, 20, 40]
+        display_list = record_display_list(rect_items(positions))
+        positions[1] = 100
+        positions[2] = 200
+
+        canvas = MockCanvas()
+        display_list.replay(canvas)
+        it("should replay what was recorded", expect=[0, 20, 40], actual=drawn_rects(canvas))
+
+        display_list.rerecord({1})
+        canvas = MockCanvas()
+        display_list.replay(canvas)
+        it("should re-record only the given items", expect=[0, 100, 40], actual=drawn_rects(canvas))
+        it("should keep spans contiguous", expect=[(0, 3), (3, 6), (6, 9)], actual=display_list.spans)
+        done()
+
+    def test_display_list_replay_items(self, done):
+        display_list = record_display_list(rect_items([0, 20, 40]))
+
+        canvas = MockCanvas()
+        display_list.replay_items(canvas, {0, 2})
+        it("should only replay draws of the given items", expect=[0, 40], actual=drawn_rects(canvas))
+        it("should replay state ops of every item",
+            expect=["save", "draw_rect", "restore", "save", "restore", "save", "draw_rect", "restore"],
+            actual=canvas_ops(canvas))
+        done()